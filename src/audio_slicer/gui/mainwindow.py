@@ -1,44 +1,758 @@
+from __future__ import annotations
+
+import bisect
+import functools
+import io
 import json
+import multiprocessing
 import os
 import subprocess
-import tempfile
-
-import soundfile
-import numpy as np
-from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
-
-from typing import List
+import threading
+
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    BrokenExecutor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, fields, replace
+
+from typing import BinaryIO, List, TYPE_CHECKING
 from PySide6.QtCore import *
 from PySide6.QtWidgets import *
 from PySide6.QtGui import *
-from audio_slicer.utils.slicer2 import Slicer, estimate_dynamic_threshold_db, build_vad_mask, get_rms
-from audio_slicer.utils.processing import process_audio_file, resolve_ffmpeg_path
 
 from audio_slicer.gui.Ui_MainWindow import Ui_MainWindow
-from audio_slicer.utils.preview import SlicingPreview
 from audio_slicer.modules import i18n
 
+# Audio stacks (soundfile, numpy, matplotlib, resamplers) are imported on first
+# use so the window can paint before they load.
+if TYPE_CHECKING:
+    import numpy as np
+    from audio_slicer.utils.slicer2 import Slicer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 APP_VERSION = "1.5.0"
+_PREVIEW_DECODE_SR = 44100
+_PREVIEW_BLOCK_FRAMES = 65536
+# Larger decodes are not kept for reuse between preview and recommendation
+_SHARED_DECODE_MAX_BYTES = 256 * 1024 * 1024
+_LANGUAGE_ITEMS = tuple(i18n.LANGUAGES.items())
+
+_STYLESHEET = """
+    QGroupBox {
+        border: 1px solid rgba(120, 120, 120, 0.28);
+        border-radius: 8px;
+        margin-top: 12px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 4px;
+    }
+    QTabWidget::pane {
+        border: 1px solid rgba(120, 120, 120, 0.22);
+        border-radius: 8px;
+    }
+    QTabBar::tab {
+        padding: 6px 12px;
+        margin-right: 4px;
+        border-radius: 8px;
+    }
+    QTabBar::tab:selected {
+        background: rgba(59, 130, 246, 0.16);
+        border-radius: 8px;
+    }
+    QLineEdit, QComboBox, QSpinBox, QDoubleSpinBox, QPlainTextEdit, QTextEdit {
+        padding: 4px 6px;
+        border-radius: 8px;
+    }
+    QComboBox::drop-down {
+        width: 20px;
+        border: none;
+    }
+    QComboBox::down-arrow {
+        width: 8px;
+        height: 8px;
+    }
+    QComboBox QAbstractItemView {
+        border: 1px solid rgba(120, 120, 120, 0.28);
+        border-radius: 8px;
+        padding: 4px;
+        background: palette(base);
+        outline: 0;
+    }
+    QComboBox QListView {
+        border-radius: 8px;
+    }
+    QComboBox QAbstractItemView::viewport {
+        border-radius: 8px;
+        background: palette(base);
+    }
+    QFrame#qt_ComboBox_Popup {
+        border-radius: 8px;
+        border: 1px solid rgba(120, 120, 120, 0.28);
+        background: palette(base);
+    }
+    QFrame#qt_ComboBox_Popup QAbstractItemView {
+        border-radius: 8px;
+        border: none;
+    }
+    QComboBox QAbstractItemView::item {
+        border-radius: 6px;
+        padding: 4px 6px;
+        margin: 2px;
+    }
+    QComboBox QAbstractItemView::item:selected {
+        background: rgba(59, 130, 246, 0.16);
+        border-radius: 6px;
+    }
+    QComboBox QAbstractItemView::item:hover {
+        background: rgba(59, 130, 246, 0.10);
+        border-radius: 6px;
+    }
+    QPushButton {
+        padding: 6px 10px;
+        border-radius: 8px;
+    }
+    QListWidget, QTableWidget, QTreeWidget, QScrollArea, QFrame {
+        border-radius: 8px;
+    }
+    QListWidget::item, QTreeWidget::item, QTableWidget::item {
+        border-radius: 6px;
+        padding: 4px 6px;
+    }
+    QListWidget::item:selected, QTreeWidget::item:selected, QTableWidget::item:selected {
+        background: rgba(59, 130, 246, 0.16);
+        border-radius: 6px;
+    }
+    QProgressBar {
+        border-radius: 8px;
+        text-align: center;
+    }
+    QProgressBar::chunk {
+        border-radius: 8px;
+    }
+    QCheckBox::indicator, QRadioButton::indicator {
+        width: 16px;
+        height: 16px;
+        border-radius: 4px;
+    }
+    QSlider::groove:horizontal {
+        height: 6px;
+        border-radius: 3px;
+    }
+    QSlider::handle:horizontal {
+        width: 14px;
+        margin: -4px 0;
+        border-radius: 7px;
+    }
+    QMessageBox {
+        border-radius: 8px;
+    }
+    QMessageBox QLabel {
+        padding: 2px 0;
+    }
+    QMessageBox QPushButton {
+        min-width: 80px;
+    }
+"""
+
+_WORKER_TEXT_KEYS = ("skipped_by_user",)
+
+# Combo item data -> i18n key, in display order
+_PARALLEL_MODE_ITEMS = (
+    ("process", "parallel_mode_process"),
+    ("thread", "parallel_mode_thread"),
+    ("single", "parallel_mode_single"),
+)
+_FALLBACK_MODE_ITEMS = (
+    ("ask", "fallback_mode_ask"),
+    ("ffmpeg_then_librosa", "fallback_mode_ffmpeg_then_librosa"),
+    ("ffmpeg", "fallback_mode_ffmpeg"),
+    ("librosa", "fallback_mode_librosa"),
+    ("skip", "fallback_mode_skip"),
+)
+_PARALLEL_MODE_KEYS = dict(_PARALLEL_MODE_ITEMS)
+_FALLBACK_MODE_KEYS = dict(_FALLBACK_MODE_ITEMS)
+
+
+@functools.cache
+def _available_formats() -> tuple[str, ...]:
+    import soundfile
+
+    # Get available formats/extensions supported
+    # libsndfile supports Opus in Ogg container
+    # .opus is a valid extension and recommended for Ogg Opus (see RFC 7845, Section 9)
+    # append opus for convenience as tools like youtube-dl(p) extract to .opus by default
+    return tuple(str(formatExt).lower() for formatExt in soundfile.available_formats().keys()) + ("opus",)
+
+
+@functools.cache
+def _audio_extensions() -> frozenset[str]:
+    return frozenset(_available_formats())
+
+
+@functools.cache
+def _format_filter() -> str:
+    formats = _available_formats()
+    format_all_filter = " ".join(f"*.{formatExt}" for formatExt in formats)
+    format_individual_filter = ";;".join(f"{formatExt} (*.{formatExt})" for formatExt in sorted(formats))
+    return f"Audio ({format_all_filter});;{format_individual_filter}"
+
+
+@functools.cache
+def _number_locale() -> QLocale:
+    # The fields are parsed with int()/float(), so validate against the C locale
+    # (dot decimals, no group separators) rather than the system one
+    locale = QLocale.c()
+    locale.setNumberOptions(QLocale.NumberOption.RejectGroupSeparator)
+    return locale
+
+
+@functools.lru_cache(maxsize=4096)
+def _t(key: str, lang: str) -> str:
+    return i18n.text(key, lang)
+
+
+def _item_text(keys: dict[str, str], value: str, lang: str) -> str:
+    # Display text of a combo value; unknown values are shown as-is
+    key = keys.get(value)
+    return value if key is None else _t(key, lang)
+
+
+@functools.cache
+def _usable_cpus() -> int:
+    # Honour CPU affinity / cgroup pinning where the platform exposes it.
+    # Read once; the window and every run size their pools from it.
+    try:
+        return max(1, len(os.sched_getaffinity(0)))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+# Default jobs per parallel mode, shared by the spinbox, the built-in presets
+# and the recommendation. Threads mostly wait on decode/encode I/O; processes
+# compete for cores.
+_PARALLEL_JOBS_DEFAULTS = {
+    "thread": min(8, 2 * _usable_cpus()),
+    "process": min(8, _usable_cpus()),
+}
+
+# Built once at import; _default_presets turns each entry into a fresh PresetData
+_DEFAULT_PRESETS: dict[str, dict] = {
+    "默认（通用）": {
+        "threshold": "-40",
+        "min_length": "5000",
+        "min_interval": "300",
+        "hop_size": "10",
+        "max_silence": "1000",
+        "output_format": "wav",
+        "name_prefix": "",
+        "name_suffix": "",
+        "name_timestamp": False,
+        "export_csv": False,
+        "export_json": False,
+        "dynamic_enabled": True,
+        "dynamic_offset_db": "6",
+        "vad_enabled": True,
+        "vad_sensitivity_db": "6",
+        "vad_hangover_ms": "120",
+        "parallel_mode": "process",
+        "parallel_jobs": _PARALLEL_JOBS_DEFAULTS["process"],
+        "fallback_mode": "ffmpeg_then_librosa",
+    },
+    "人声（保守）": {
+        "threshold": "-45",
+        "min_length": "6000",
+        "min_interval": "400",
+        "hop_size": "10",
+        "max_silence": "1500",
+        "output_format": "wav",
+        "name_prefix": "",
+        "name_suffix": "",
+        "name_timestamp": False,
+        "export_csv": False,
+        "export_json": False,
+        "dynamic_enabled": True,
+        "dynamic_offset_db": "5",
+        "vad_enabled": True,
+        "vad_sensitivity_db": "7",
+        "vad_hangover_ms": "180",
+        "parallel_mode": "process",
+        "parallel_jobs": _PARALLEL_JOBS_DEFAULTS["process"],
+        "fallback_mode": "ffmpeg_then_librosa",
+    },
+    "人声（激进）": {
+        "threshold": "-35",
+        "min_length": "3000",
+        "min_interval": "200",
+        "hop_size": "10",
+        "max_silence": "600",
+        "output_format": "wav",
+        "name_prefix": "",
+        "name_suffix": "",
+        "name_timestamp": False,
+        "export_csv": False,
+        "export_json": False,
+        "dynamic_enabled": True,
+        "dynamic_offset_db": "7",
+        "vad_enabled": True,
+        "vad_sensitivity_db": "5",
+        "vad_hangover_ms": "80",
+        "parallel_mode": "process",
+        "parallel_jobs": _PARALLEL_JOBS_DEFAULTS["process"],
+        "fallback_mode": "ffmpeg_then_librosa",
+    },
+    "长音频": {
+        "threshold": "-40",
+        "min_length": "8000",
+        "min_interval": "500",
+        "hop_size": "20",
+        "max_silence": "2000",
+        "output_format": "flac",
+        "name_prefix": "",
+        "name_suffix": "",
+        "name_timestamp": True,
+        "export_csv": True,
+        "export_json": False,
+        "dynamic_enabled": True,
+        "dynamic_offset_db": "6",
+        "vad_enabled": True,
+        "vad_sensitivity_db": "6",
+        "vad_hangover_ms": "200",
+        "parallel_mode": "process",
+        "parallel_jobs": _PARALLEL_JOBS_DEFAULTS["process"],
+        "fallback_mode": "ffmpeg_then_librosa",
+    },
+    "播客/对白": {
+        "threshold": "-42",
+        "min_length": "4000",
+        "min_interval": "250",
+        "hop_size": "10",
+        "max_silence": "1200",
+        "output_format": "wav",
+        "name_prefix": "",
+        "name_suffix": "",
+        "name_timestamp": False,
+        "export_csv": True,
+        "export_json": True,
+        "dynamic_enabled": True,
+        "dynamic_offset_db": "6",
+        "vad_enabled": True,
+        "vad_sensitivity_db": "6",
+        "vad_hangover_ms": "150",
+        "parallel_mode": "process",
+        "parallel_jobs": _PARALLEL_JOBS_DEFAULTS["process"],
+        "fallback_mode": "ffmpeg_then_librosa",
+    },
+}
+
+
+def _ffmpeg_path() -> str | None:
+    from audio_slicer.utils.processing import resolve_ffmpeg_path
+
+    return resolve_ffmpeg_path()
+
+
+def _loads_json(data: bytes):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps_json(obj) -> bytes:
+    # Compact output; the presets file is not meant to be edited by hand
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _run_lengths(mask: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    import numpy as np
+
+    # Run-length encode a boolean mask: (length, value) of every run, in order
+    if mask.size == 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=bool)
+    ends = np.append(np.flatnonzero(mask[1:] != mask[:-1]), mask.size - 1)
+    lengths = np.diff(ends, prepend=-1)
+    return lengths, mask[ends]
+
+
+def _percentiles(values: np.ndarray, qs: tuple[float, ...]) -> list[float]:
+    import numpy as np
+
+    # np.percentile's default linear method, taking every pivot from a single
+    # np.partition instead of paying its generic setup once per call
+    last = values.size - 1
+    positions = [q / 100 * last for q in qs]
+    lows = [int(pos) for pos in positions]
+    part = np.partition(values, sorted({k for low in lows for k in (low, min(low + 1, last))}))
+    result = []
+    for low, pos in zip(lows, positions):
+        a = float(part[low])
+        b = float(part[min(low + 1, last)])
+        t = pos - low
+        result.append(a + (b - a) * t if t < 0.5 else b - (b - a) * (1 - t))
+    return result
+
+
+def _tight_layout(layout: QBoxLayout, spacing: int = 6) -> QBoxLayout:
+    # Margin-free box for nesting controls inside a form row
+    layout.setContentsMargins(0, 0, 0, 0)
+    layout.setSpacing(spacing)
+    return layout
+
+
+def _scaled_pixmap(pixmap: QPixmap, size: QSize) -> QPixmap:
+    # Every preview render gets a new cacheKey, so stale scales are never hit
+    key = f"preview:{pixmap.cacheKey()}:{size.width()}x{size.height()}"
+    scaled = QPixmapCache.find(key)
+    if scaled is None:
+        scaled = pixmap.scaled(size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        QPixmapCache.insert(key, scaled)
+    return scaled
+
+
+def _read_mono(file: str | BinaryIO) -> tuple[np.ndarray, int]:
+    import numpy as np
+    import soundfile
+    from audio_slicer.utils.slicer2 import downmix
+
+    with soundfile.SoundFile(file) as f:
+        sr = f.samplerate
+        if f.channels == 1:
+            return f.read(dtype=np.float32), sr
+        # Preview and analysis only need mono, so mix block by block into one
+        # buffer instead of decoding every channel of the whole file.
+        audio = np.empty(f.frames, dtype=np.float32)
+        pos = 0
+        for block in f.blocks(blocksize=_PREVIEW_BLOCK_FRAMES, dtype=np.float32):
+            mono = downmix(block.T)
+            end = pos + len(mono)
+            if end > len(audio):
+                audio = np.concatenate((audio[:pos], mono))
+            else:
+                audio[pos:end] = mono
+            pos = end
+    return audio[:pos], sr
+
+
+def _read_mono_cached(filename: str, last: tuple | None) -> tuple[tuple, np.ndarray, int]:
+    # Returns (key, audio, sr); the caller decides whether to keep it as the
+    # new last decode, so this is safe to call from a worker thread.
+    stat = os.stat(filename)
+    key = (filename, stat.st_mtime_ns, stat.st_size)
+    if last is not None and last[0] == key:
+        return last
+    audio, sr = _read_mono(filename)
+    return key, audio, sr
+
+
+@dataclass(frozen=True, slots=True)
+class ProcessingOptions:
+    threshold_db: float
+    min_length: int
+    min_interval: int
+    hop_size: int
+    max_silence: int
+    dynamic_enabled: bool
+    dynamic_offset_db: float
+    vad_enabled: bool
+    vad_sensitivity_db: float
+    vad_hangover_ms: int
+    parallel_mode: str
+    parallel_jobs: int
+    fallback_mode: str
+    name_prefix: str
+    name_suffix: str
+    name_timestamp: bool
+    export_csv: bool
+    export_json: bool
+    output_dir: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class SliceAnalysisOptions:
+    dynamic_enabled: bool
+    dynamic_offset_db: float
+    vad_enabled: bool
+    vad_sensitivity_db: float
+    hangover_frames: int
+
+
+@dataclass(slots=True)
+class PresetData:
+    # None leaves the matching control untouched when the preset is applied
+    threshold: str | None = None
+    min_length: str | None = None
+    min_interval: str | None = None
+    hop_size: str | None = None
+    max_silence: str | None = None
+    output_format: str | None = None
+    name_prefix: str | None = None
+    name_suffix: str | None = None
+    name_timestamp: bool | None = None
+    export_csv: bool | None = None
+    export_json: bool | None = None
+    dynamic_enabled: bool | None = None
+    dynamic_offset_db: str | None = None
+    vad_enabled: bool | None = None
+    vad_sensitivity_db: str | None = None
+    vad_hangover_ms: str | None = None
+    parallel_mode: str | None = None
+    parallel_jobs: int | None = None
+    fallback_mode: str | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict) -> PresetData:
+        return cls(**{name: data[name] for name in _PRESET_FIELDS if name in data})
+
+    def to_dict(self) -> dict:
+        # Unset fields are left out so the file keeps its sparse shape
+        return {
+            name: value
+            for name in _PRESET_FIELDS
+            if (value := getattr(self, name)) is not None
+        }
 
 
-class _FallbackBridge(QObject):
-    request = Signal(str, str)
+_PRESET_FIELDS = tuple(field.name for field in fields(PresetData))
+
+
+class WorkThread(QThread):
+    progressDelta = Signal(int)
+    errorOccurred = Signal(str, str)
+
+    def __init__(
+        self,
+        filenames: List[str],
+        window: "MainWindow",
+        options: ProcessingOptions,
+        base_kwargs: dict,
+        texts: dict[str, str],
+        process_pool: ProcessPoolExecutor | None = None,
+    ):
+        super().__init__()
+
+        self.filenames = filenames
+        self.win = window
+        self.options = options
+        self.base_kwargs = base_kwargs
+        self.texts = texts
+        self.process_pool = process_pool
+        self.pool_broken = False
+        self._fallback_kwargs: dict[str, dict] = {}
+        # Completions are reported in batches to keep cross-thread signals rare
+        self._done_pending = 0
+        self._done_batch = max(1, len(filenames) // 200)
+        self._done_timer = QElapsedTimer()
+
+    def run(self):
+        self._done_timer.start()
+        try:
+            self._run_batch()
+        finally:
+            if self._done_pending:
+                self.progressDelta.emit(self._done_pending)
+                self._done_pending = 0
+
+    def _report_done(self):
+        self._done_pending += 1
+        if self._done_pending >= self._done_batch or self._done_timer.elapsed() >= 50:
+            self.progressDelta.emit(self._done_pending)
+            self._done_pending = 0
+            self._done_timer.restart()
+
+    def _run_batch(self):
+        from audio_slicer.utils.processing import process_audio_files_in_worker
+
+        mode = self.options.parallel_mode
+        if mode == "single":
+            for filename in self.filenames:
+                try:
+                    self._process_file(filename)
+                finally:
+                    self._report_done()
+            return
+        if mode == "thread":
+            jobs = min(self.options.parallel_jobs, len(self.filenames))
+            with ThreadPoolExecutor(max_workers=jobs) as executor:
+                for filename, future in self._iter_completed(executor, self._process_file, self.filenames, 2 * jobs):
+                    try:
+                        future.result()
+                    except Exception as exc:
+                        self.errorOccurred.emit(filename, str(exc))
+                    finally:
+                        self._report_done()
+            return
+        # The pool is owned by the window and outlives this run; the settings
+        # go with every task. Files travel in chunks so each task round-trip
+        # (and the settings pickle) is amortized over several of them.
+        workers = self.options.parallel_jobs
+        chunksize = max(1, len(self.filenames) // (4 * workers))
+        chunks = [
+            tuple(self.filenames[i:i + chunksize])
+            for i in range(0, len(self.filenames), chunksize)
+        ]
+        task = functools.partial(process_audio_files_in_worker, kwargs=self.base_kwargs)
+        for chunk, future in self._iter_completed(self.process_pool, task, chunks, 2 * workers):
+            try:
+                results = future.result()
+            except BrokenProcessPool as exc:
+                # A worker died; the window replaces the pool before the next run
+                self.pool_broken = True
+                results = [(False, str(exc) or "Unknown error.", None)] * len(chunk)
+            except Exception as exc:
+                results = [(False, str(exc) or "Unknown error.", None)] * len(chunk)
+            for filename, (ok, error, out_dir) in zip(chunk, results):
+                if ok:
+                    if out_dir:
+                        self.win.last_output_dir = out_dir
+                else:
+                    self.errorOccurred.emit(filename, error or "Unknown error.")
+                self._report_done()
+
+    def _iter_completed(self, executor, fn, items, limit: int):
+        # Keep at most `limit` tasks in flight so huge batches do not queue every
+        # task (and its pending result) up front; yields (item, future).
+        pending = {}
+        for item in items:
+            if len(pending) >= limit:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield pending.pop(future), future
+            try:
+                future = executor.submit(fn, item)
+            except BrokenExecutor as exc:
+                # Report the rest of the batch through the same path as failures
+                future = Future()
+                future.set_exception(exc)
+            pending[future] = item
+        for future in as_completed(pending):
+            yield pending[future], future
+
+    def _process_file(self, filename: str) -> bool:
+        from audio_slicer.utils.processing import process_audio_file
+
+        if self.options.fallback_mode == "ask":
+            try:
+                ok, error, out_dir = process_audio_file(
+                    filename,
+                    **self._build_process_kwargs(fallback_mode="skip"),
+                )
+            except Exception as exc:
+                self.errorOccurred.emit(filename, str(exc))
+                return False
+            if ok:
+                if out_dir:
+                    self.win.last_output_dir = out_dir
+                return True
+            choice = self.win._request_fallback_choice(filename, error or "")
+            if choice == "ffmpeg":
+                try:
+                    ok, error, out_dir = process_audio_file(
+                        filename,
+                        **self._build_process_kwargs(fallback_mode="ffmpeg"),
+                    )
+                except Exception as exc:
+                    self.errorOccurred.emit(filename, str(exc))
+                    return False
+            elif choice == "librosa":
+                try:
+                    ok, error, out_dir = process_audio_file(
+                        filename,
+                        **self._build_process_kwargs(fallback_mode="librosa"),
+                    )
+                except Exception as exc:
+                    self.errorOccurred.emit(filename, str(exc))
+                    return False
+            else:
+                self.errorOccurred.emit(
+                    filename,
+                    self.texts["skipped_by_user"],
+                )
+                return False
+            if ok:
+                if out_dir:
+                    self.win.last_output_dir = out_dir
+                return True
+            self.errorOccurred.emit(filename, error or "Unknown error.")
+            return False
 
-    def __init__(self, window: "MainWindow"):
+        try:
+            ok, error, out_dir = process_audio_file(
+                filename,
+                **self._build_process_kwargs(),
+            )
+        except Exception as exc:
+            self.errorOccurred.emit(filename, str(exc))
+            return False
+        if ok:
+            if out_dir:
+                self.win.last_output_dir = out_dir
+            return True
+        self.errorOccurred.emit(filename, error or "Unknown error.")
+        return False
+
+    def _build_process_kwargs(self, fallback_mode: str | None = None) -> dict:
+        if fallback_mode is None:
+            return self.base_kwargs
+        # The "ask" flow needs the same few overrides for every file
+        kwargs = self._fallback_kwargs.get(fallback_mode)
+        if kwargs is None:
+            kwargs = {**self.base_kwargs, "fallback_mode": fallback_mode}
+            self._fallback_kwargs[fallback_mode] = kwargs
+        return kwargs
+
+
+class RecommendThread(QThread):
+    # Decodes and analyses one file for the recommend button off the GUI thread.
+    # recommended carries (rec, decode); decode is the (key, audio, sr) entry
+    # for the GUI thread to keep, or None.
+    recommended = Signal(object)
+    readFailed = Signal(str)
+
+    def __init__(
+        self,
+        filename: str,
+        window: "MainWindow",
+        decoder: str = "soundfile",
+        last_decode: tuple | None = None,
+    ):
         super().__init__()
-        self.window = window
-        self.mutex = QMutex()
-        self.cond = QWaitCondition()
-        self.choice: str | None = None
-        self.request.connect(self._on_request)
 
-    @Slot(str, str)
-    def _on_request(self, filename: str, error: str):
-        choice = self.window._show_fallback_dialog("process_read_failed", filename, error)
-        self.mutex.lock()
-        self.choice = choice
-        self.cond.wakeAll()
-        self.mutex.unlock()
+        self.filename = filename
+        self.win = window
+        self.decoder = decoder
+        self.last_decode = last_decode
+
+    def run(self):
+        decode = None
+        if self.decoder == "ffmpeg":
+            audio, sr = self.win._read_audio_with_ffmpeg(self.filename)
+        elif self.decoder == "librosa":
+            audio, sr = self.win._read_audio_with_librosa(self.filename)
+        else:
+            try:
+                decode = _read_mono_cached(self.filename, self.last_decode)
+            except Exception as exc:
+                # The fallback choice is a dialog, so it is asked on the GUI thread
+                self.readFailed.emit(str(exc))
+                return
+            _, audio, sr = decode
+        if audio is None or sr is None:
+            self.recommended.emit((None, None))
+            return
+        self.recommended.emit((self.win._compute_recommendations(audio, sr), decode))
 
 
 class MainWindow(QMainWindow):
@@ -72,22 +786,34 @@ class MainWindow(QMainWindow):
         self.ui.progressBar.setValue(0)
         self.ui.btnStart.setDefault(True)
 
-        validator = QRegularExpressionValidator(QRegularExpression(r"\d+"))
-        self.ui.leThreshold.setValidator(QDoubleValidator())
-        self.ui.leMinLen.setValidator(validator)
-        self.ui.leMinInterval.setValidator(validator)
-        self.ui.leHopSize.setValidator(validator)
-        self.ui.leMaxSilence.setValidator(validator)
+        # One validator per kind of field, shared by every line edit of that kind
+        self._int_validator = QIntValidator(0, 10_000_000, self)
+        self._int_validator.setLocale(_number_locale())
+        threshold_validator = QDoubleValidator(-100.0, 0.0, 2, self)
+        threshold_validator.setLocale(_number_locale())
+        self.ui.leThreshold.setValidator(threshold_validator)
+        self.ui.leMinLen.setValidator(self._int_validator)
+        self.ui.leMinInterval.setValidator(self._int_validator)
+        self.ui.leHopSize.setValidator(self._int_validator)
+        self.ui.leMaxSilence.setValidator(self._int_validator)
 
         self.ui.lwTaskList.setAlternatingRowColors(True)
+        # Every row has the same fixed size hint, so skip per-item measurement.
+        self.ui.lwTaskList.setUniformItemSizes(True)
 
         # State variables
         self.workers: list[QThread] = []
         self.workCount = 0
         self.workFinished = 0
         self.processing = False
+        self._errors: list[tuple[str, str]] = []
         self.last_output_dir: str | None = None
 
+        # Repaint the progress bar at ~30 Hz instead of once per finished file
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(33)
+        self._progress_timer.timeout.connect(self._flushProgress)
+
         # Language setup
         self.current_language = i18n.normalize_language(QLocale.system().name())
         self._preview_embed = False
@@ -98,30 +824,50 @@ class MainWindow(QMainWindow):
         self._preview_zoom_slider: QSlider | None = None
         self._preview_original_pixmap: QPixmap | None = None
         self._preview_scroll_viewport: QWidget | None = None
-        self._preview_pixmap_path: str | None = None
-        self._style_sheet: str | None = None
+        self._preview_source_pixmap: QPixmap | None = None
+        self._preview_last_scaled: tuple[int, int, int] | None = None
+        # Room for a few full-size preview scales (limit is in KiB)
+        QPixmapCache.setCacheLimit(64 * 1024)
+        # Rescale the embedded preview once the window stops resizing
+        self._preview_resize_timer = QTimer(self)
+        self._preview_resize_timer.setSingleShot(True)
+        self._preview_resize_timer.setInterval(40)
+        self._preview_resize_timer.timeout.connect(self._update_preview_pixmap)
+        # Same for zoom slider drags in the preview window
+        self._preview_zoom_timer = QTimer(self)
+        self._preview_zoom_timer.setSingleShot(True)
+        self._preview_zoom_timer.setInterval(40)
+        self._preview_zoom_timer.timeout.connect(self._update_preview_zoom)
+        self._theme: str | None = None
+        # Full paths of the task list rows, in row order
+        self._queued_paths: list[str] = []
+        # Worker processes are kept between runs to skip respawn/import cost
+        self._process_pool: ProcessPoolExecutor | None = None
+        self._process_pool_workers: int | None = None
+        # Bytes of the last write; an identical save is skipped. Only touched
+        # on the GUI thread, the writer thread reports failures back instead
+        self._presets_written: bytes | None = None
+        self._preset_writer: ThreadPoolExecutor | None = None
+        # (path, mtime_ns, size) -> recommendation, oldest evicted first
+        self._recommend_cache: dict[tuple, dict] = {}
+        self._recommend_thread: RecommendThread | None = None
+        # ((path, mtime_ns, size), mono audio, sr) of the last shared decode
+        self._last_decode: tuple[tuple, np.ndarray, int] | None = None
+        # Coalesce preset edits into one deferred write
+        self._preset_save_timer = QTimer(self)
+        self._preset_save_timer.setSingleShot(True)
+        self._preset_save_timer.setInterval(500)
+        self._preset_save_timer.timeout.connect(self._save_presets)
         self._init_language_selector()
         self._init_extra_ui()
+        self._init_language_bindings()
         self._load_presets()
         self._apply_language()
-        self._fallback_bridge = _FallbackBridge(self)
-        self._fallback_request_lock = QMutex()
+        self._fallback_request_lock = threading.Lock()
 
         # Must set to accept drag and drop events
         self.setAcceptDrops(True)
 
-        # Get available formats/extensions supported
-        self.availableFormats = [str(formatExt).lower()
-                                 for formatExt in soundfile.available_formats().keys()]
-        # libsndfile supports Opus in Ogg container
-        # .opus is a valid extension and recommended for Ogg Opus (see RFC 7845, Section 9)
-        # append opus for convenience as tools like youtube-dl(p) extract to .opus by default
-        self.availableFormats.append("opus")
-        self.formatAllFilter = " ".join(
-            [f"*.{formatExt}" for formatExt in self.availableFormats])
-        self.formatIndividualFilter = ";;".join(
-            [f"{formatExt} (*.{formatExt})" for formatExt in sorted(self.availableFormats)])
-
     def _on_tab_close_requested(self, index):
         self.ui.twImages.removeTab(index)
 
@@ -138,23 +884,39 @@ class MainWindow(QMainWindow):
 
         paths, _ = QFileDialog.getOpenFileNames(
             self,
-            i18n.text("select_audio_files", self.current_language),
+            _t("select_audio_files", self.current_language),
             ".",
-            f"Audio ({self.formatAllFilter});;{self.formatIndividualFilter}",
+            _format_filter(),
         )
-        for path in paths:
-            item = QListWidgetItem()
-            item.setSizeHint(QSize(200, 24))
-            item.setText(QFileInfo(path).fileName())
-            # Save full path at custom role
-            item.setData(Qt.ItemDataRole.UserRole + 1, path)
-            self.ui.lwTaskList.addItem(item)
+        self._append_task_items(paths)
+
+    def _append_task_items(self, paths):
+        if not paths:
+            return
+        self._queued_paths.extend(paths)
+        task_list = self.ui.lwTaskList
+        task_list.setUpdatesEnabled(False)
+        task_list.blockSignals(True)
+        try:
+            for path in paths:
+                item = QListWidgetItem()
+                item.setSizeHint(QSize(200, 24))
+                item.setText(QFileInfo(path).fileName())
+                # Save full path at custom role
+                item.setData(Qt.ItemDataRole.UserRole + 1, path)
+                task_list.addItem(item)
+        finally:
+            task_list.blockSignals(False)
+            task_list.setUpdatesEnabled(True)
+            task_list.viewport().update()
 
     def _on_remove_audio_file(self):
         item = self.ui.lwTaskList.currentItem()
         if item is None:
             return
-        self.ui.lwTaskList.takeItem(self.ui.lwTaskList.row(item))
+        row = self.ui.lwTaskList.row(item)
+        self.ui.lwTaskList.takeItem(row)
+        del self._queued_paths[row]
         return
 
     def _on_clear_audio_list(self):
@@ -163,13 +925,14 @@ class MainWindow(QMainWindow):
             return
 
         self.ui.lwTaskList.clear()
+        self._queued_paths.clear()
 
     def _on_about(self):
         language_label = i18n.LANGUAGES.get(self.current_language, self.current_language)
         QMessageBox.information(
             self,
-            i18n.text("about", self.current_language),
-            i18n.text("about_text", self.current_language).format(
+            _t("about", self.current_language),
+            _t("about_text", self.current_language).format(
                 version=APP_VERSION,
                 language=language_label,
             ),
@@ -183,13 +946,15 @@ class MainWindow(QMainWindow):
         item_count = self.ui.lwTaskList.count()
         if item_count == 0:
             return
+        if not self._check_numeric_values():
+            return
 
         output_format = self._get_output_format()
         if output_format == "mp3":
             ret = QMessageBox.warning(
                 self,
-                i18n.text("warning_title", self.current_language),
-                i18n.text("mp3_warning", self.current_language),
+                _t("warning_title", self.current_language),
+                _t("mp3_warning", self.current_language),
                 QMessageBox.Ok | QMessageBox.Cancel,
                 QMessageBox.Cancel,
             )
@@ -197,240 +962,146 @@ class MainWindow(QMainWindow):
                 return
 
         options = self._collect_processing_options()
-        if options["parallel_mode"] == "process" and options["fallback_mode"] == "ask":
-            ret = QMessageBox.warning(
-                self,
-                i18n.text("warning_title", self.current_language),
-                i18n.text("parallel_process_fallback_hint", self.current_language),
-                QMessageBox.Ok | QMessageBox.Cancel,
-                QMessageBox.Ok,
-            )
-            if ret == QMessageBox.Cancel:
-                return
-            options["fallback_mode"] = "ffmpeg_then_librosa"
-
-        class WorkThread(QThread):
-            oneFinished = Signal()
-            errorOccurred = Signal(str, str)
-
-            def __init__(self, filenames: List[str], window: MainWindow, output_ext: str, options: dict):
-                super().__init__()
-
-                self.filenames = filenames
-                self.win = window
-                self.output_ext = output_ext
-                self.options = options
-
-            def run(self):
-                mode = self.options["parallel_mode"]
-                if mode == "single":
-                    for filename in self.filenames:
-                        try:
-                            self._process_file(filename)
-                        finally:
-                            self.oneFinished.emit()
-                    return
-                if mode == "thread":
-                    with ThreadPoolExecutor(max_workers=self.options["parallel_jobs"]) as executor:
-                        futures = {
-                            executor.submit(self._process_file, filename): filename
-                            for filename in self.filenames
-                        }
-                        for future in as_completed(futures):
-                            filename = futures[future]
-                            try:
-                                future.result()
-                            except Exception as exc:
-                                self.errorOccurred.emit(filename, str(exc))
-                            finally:
-                                self.oneFinished.emit()
-                    return
-                with ProcessPoolExecutor(max_workers=self.options["parallel_jobs"]) as executor:
-                    futures = {
-                        executor.submit(
-                            process_audio_file,
-                            filename,
-                            **self._build_process_kwargs(),
-                        ): filename
-                        for filename in self.filenames
-                    }
-                    for future in as_completed(futures):
-                        filename = futures[future]
-                        try:
-                            ok, error, out_dir = future.result()
-                            if ok:
-                                if out_dir:
-                                    self.win.last_output_dir = out_dir
-                            else:
-                                self.errorOccurred.emit(filename, error or "Unknown error.")
-                        except Exception as exc:
-                            self.errorOccurred.emit(filename, str(exc))
-                        finally:
-                            self.oneFinished.emit()
-
-            def _process_file(self, filename: str) -> bool:
-                if self.options["fallback_mode"] == "ask":
-                    try:
-                        ok, error, out_dir = process_audio_file(
-                            filename,
-                            **self._build_process_kwargs(fallback_mode="skip"),
-                        )
-                    except Exception as exc:
-                        self.errorOccurred.emit(filename, str(exc))
-                        return False
-                    if ok:
-                        if out_dir:
-                            self.win.last_output_dir = out_dir
-                        return True
-                    choice = self.win._request_fallback_choice(filename, error or "")
-                    if choice == "ffmpeg":
-                        try:
-                            ok, error, out_dir = process_audio_file(
-                                filename,
-                                **self._build_process_kwargs(fallback_mode="ffmpeg"),
-                            )
-                        except Exception as exc:
-                            self.errorOccurred.emit(filename, str(exc))
-                            return False
-                    elif choice == "librosa":
-                        try:
-                            ok, error, out_dir = process_audio_file(
-                                filename,
-                                **self._build_process_kwargs(fallback_mode="librosa"),
-                            )
-                        except Exception as exc:
-                            self.errorOccurred.emit(filename, str(exc))
-                            return False
-                    else:
-                        self.errorOccurred.emit(
-                            filename,
-                            i18n.text("skipped_by_user", self.win.current_language),
-                        )
-                        return False
-                    if ok:
-                        if out_dir:
-                            self.win.last_output_dir = out_dir
-                        return True
-                    self.errorOccurred.emit(filename, error or "Unknown error.")
-                    return False
-
-                try:
-                    ok, error, out_dir = process_audio_file(
-                        filename,
-                        **self._build_process_kwargs(),
-                    )
-                except Exception as exc:
-                    self.errorOccurred.emit(filename, str(exc))
-                    return False
-                if ok:
-                    if out_dir:
-                        self.win.last_output_dir = out_dir
-                    return True
-                self.errorOccurred.emit(filename, error or "Unknown error.")
-                return False
+        fallback_notice = None
+        if options.parallel_mode == "process" and options.fallback_mode == "ask":
+            # Worker processes cannot prompt, so fall back automatically and
+            # say so in the status bar instead of a blocking dialog
+            options = replace(options, fallback_mode="ffmpeg_then_librosa")
+            fallback_notice = "parallel_process_fallback_hint"
+        elif options.parallel_mode == "thread" and options.fallback_mode == "librosa":
+            # Threads only scale while decoding stays in libsndfile/ffmpeg, which
+            # release the GIL; librosa decodes under it, so keep it as last resort
+            options = replace(options, fallback_mode="ffmpeg_then_librosa")
+            fallback_notice = "thread_librosa_fallback_hint"
+
+        if fallback_notice is not None:
+            self.statusBar().showMessage(_t(fallback_notice, self.current_language))
+        else:
+            self.statusBar().clearMessage()
 
-            def _build_process_kwargs(self, fallback_mode: str | None = None) -> dict:
-                opts = self.options
-                return {
-                    "output_ext": self.output_ext,
-                    "threshold_db": opts["threshold_db"],
-                    "min_length": opts["min_length"],
-                    "min_interval": opts["min_interval"],
-                    "hop_size": opts["hop_size"],
-                    "max_silence": opts["max_silence"],
-                    "dynamic_enabled": opts["dynamic_enabled"],
-                    "dynamic_offset_db": opts["dynamic_offset_db"],
-                    "vad_enabled": opts["vad_enabled"],
-                    "vad_sensitivity_db": opts["vad_sensitivity_db"],
-                    "vad_hangover_ms": opts["vad_hangover_ms"],
-                    "name_prefix": opts["name_prefix"],
-                    "name_suffix": opts["name_suffix"],
-                    "name_timestamp": opts["name_timestamp"],
-                    "export_csv": opts["export_csv"],
-                    "export_json": opts["export_json"],
-                    "output_dir": opts["output_dir"],
-                    "fallback_mode": fallback_mode or opts["fallback_mode"],
-                    "language": self.win.current_language,
-                }
-
-        # Collect paths
-        paths: list[str] = []
-        for i in range(0, item_count):
-            item = self.ui.lwTaskList.item(i)
-            path = item.data(Qt.ItemDataRole.UserRole + 1)  # Get full path
-            paths.append(path)
+        paths = list(self._queued_paths)
 
         self.ui.progressBar.setMaximum(item_count)
         self.ui.progressBar.setValue(0)
 
         self.workCount = item_count
         self.workFinished = 0
+        self._errors.clear()
         self._setProcessing(True)
 
         # Start work thread
-        worker = WorkThread(paths, self, output_format, options)
-        worker.oneFinished.connect(self._oneFinished)
+        base_kwargs = self._collect_process_kwargs(options, output_format)
+        process_pool = None
+        if options.parallel_mode == "process":
+            process_pool = self._get_process_pool(options.parallel_jobs)
+        # Messages the worker needs, resolved once in the run's language
+        texts = {key: _t(key, self.current_language) for key in _WORKER_TEXT_KEYS}
+        self.workers = [worker for worker in self.workers if worker.isRunning()]
+        worker = WorkThread(paths, self, options, base_kwargs, texts, process_pool)
+        worker.progressDelta.connect(self._on_progress_delta)
         worker.errorOccurred.connect(self._on_worker_error)
         worker.finished.connect(self._threadFinished)
         worker.start()
 
         self.workers.append(worker)  # Collect in case of auto deletion
 
-    def _oneFinished(self):
-        self.workFinished += 1
-        self.ui.progressBar.setValue(self.workFinished)
+    def _on_progress_delta(self, count: int):
+        self.workFinished += count
+
+    def _flushProgress(self):
+        if self.ui.progressBar.value() != self.workFinished:
+            self.ui.progressBar.setValue(self.workFinished)
 
     def _on_worker_error(self, filename: str, error: str):
-        QMessageBox.warning(
-            self,
-            i18n.text("warning_title", self.current_language),
-            i18n.text("read_failed", self.current_language).format(
-                file=filename,
-                error=error,
-            ),
-        )
+        # Reported together once the run ends; a modal box per file would
+        # stall the event loop for the rest of the batch
+        self._errors.append((filename, error))
 
     def _request_fallback_choice(self, filename: str, error: str) -> str:
-        self._fallback_request_lock.lock()
-        try:
-            bridge = self._fallback_bridge
-            bridge.mutex.lock()
-            bridge.choice = None
-            bridge.request.emit(filename, error)
-            while bridge.choice is None:
-                bridge.cond.wait(bridge.mutex)
-            choice = bridge.choice or "cancel"
-            bridge.mutex.unlock()
-            return choice
-        finally:
-            self._fallback_request_lock.unlock()
+        # Runs the dialog on the GUI thread and blocks this worker for the answer.
+        # The lock keeps concurrent workers from stacking dialogs, since the
+        # dialog's nested event loop would otherwise dispatch the next request.
+        with self._fallback_request_lock:
+            choice = QMetaObject.invokeMethod(
+                self,
+                "_show_fallback_dialog",
+                Qt.BlockingQueuedConnection,
+                Q_RETURN_ARG(str),
+                Q_ARG(str, "process_read_failed"),
+                Q_ARG(str, filename),
+                Q_ARG(str, error),
+            )
+        return choice or "cancel"
+
+    def _get_process_pool(self, workers: int) -> ProcessPoolExecutor:
+        from audio_slicer.utils.processing import init_process_worker
+
+        # Settings travel with each task, so only a new worker count needs
+        # a fresh pool (and another round of spawn-time imports).
+        if self._process_pool is None or workers != self._process_pool_workers:
+            self._shutdown_process_pool()
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=init_process_worker,
+            )
+            self._process_pool_workers = workers
+        return self._process_pool
+
+    def _shutdown_process_pool(self):
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False, cancel_futures=True)
+            self._process_pool = None
+            self._process_pool_workers = None
 
     def _threadFinished(self):
-        # Join all workers
+        # finished is emitted from the worker thread just before it returns, so
+        # the references are kept (not joined) and dropped on the next start
         for worker in self.workers:
-            worker.wait()
-        self.workers.clear()
+            if worker.pool_broken:
+                self._shutdown_process_pool()
         self._setProcessing(False)
+        self._flushProgress()
 
-        QMessageBox.information(
-            self,
-            QApplication.applicationName(),
-            i18n.text("slicing_complete", self.current_language),
-        )
+        if self._errors:
+            self._show_slicing_errors()
+        else:
+            QMessageBox.information(
+                self,
+                QApplication.applicationName(),
+                _t("slicing_complete", self.current_language),
+            )
         if self.ui.cbxOpenOutuptDirectory.isChecked() and self.last_output_dir:
             QDesktopServices.openUrl(QUrl.fromLocalFile(self.last_output_dir))
 
+    def _show_slicing_errors(self):
+        msg = QMessageBox(self)
+        msg.setIcon(QMessageBox.Warning)
+        msg.setWindowTitle(QApplication.applicationName())
+        msg.setText(
+            _t("slicing_complete", self.current_language)
+            + "\n\n"
+            + _t("slicing_errors", self.current_language).format(count=len(self._errors))
+        )
+        msg.setDetailedText(
+            "\n\n".join(
+                _t("read_failed", self.current_language).format(file=filename, error=error)
+                for filename, error in self._errors
+            )
+        )
+        msg.exec()
+
     def _warningProcessNotFinished(self):
         QMessageBox.warning(
             self,
             QApplication.applicationName(),
-            i18n.text("process_not_finished", self.current_language),
+            _t("process_not_finished", self.current_language),
         )
 
     def _setProcessing(self, processing: bool):
         is_enabled = not processing
         self.ui.btnStart.setText(
-            i18n.text("slicing", self.current_language) if processing else i18n.text("start", self.current_language))
+            _t("slicing", self.current_language) if processing else _t("start", self.current_language))
         self.ui.btnStart.setEnabled(is_enabled)
         self.ui.btnPreviewSelection.setEnabled(is_enabled)
         self.ui.btnAddFiles.setEnabled(is_enabled)
@@ -460,7 +1131,12 @@ class MainWindow(QMainWindow):
         self.ui.cbParallelMode.setEnabled(is_enabled)
         self.ui.sbParallelJobs.setEnabled(is_enabled)
         self.ui.cbFallbackMode.setEnabled(is_enabled)
-        self.ui.btnRecommend.setEnabled(is_enabled)
+        recommending = self._recommend_thread is not None and self._recommend_thread.isRunning()
+        self.ui.btnRecommend.setEnabled(is_enabled and not recommending)
+        if processing:
+            self._progress_timer.start()
+        else:
+            self._progress_timer.stop()
         self.processing = processing
 
     def _init_extra_ui(self):
@@ -491,7 +1167,6 @@ class MainWindow(QMainWindow):
         action_row.addStretch()
         action_row.addWidget(self.ui.btnPreviewSelection)
         preview_layout.addLayout(action_row)
-        self._preview_pixmap_path: str | None = None
 
     def _init_settings_tabs(self):
         self.ui.settingsTabs = QTabWidget(self.ui.groupBox_2)
@@ -545,10 +1220,6 @@ class MainWindow(QMainWindow):
         self.ui.mainSplitter.setStretchFactor(0, 3)
         self.ui.mainSplitter.setStretchFactor(1, 2)
 
-        while self.ui.horizontalLayout.count():
-            item = self.ui.horizontalLayout.takeAt(0)
-            if item.widget():
-                item.widget().setParent(None)
         self.ui.horizontalLayout.addWidget(self.ui.mainSplitter)
 
     def _apply_layout_style(self):
@@ -577,130 +1248,13 @@ class MainWindow(QMainWindow):
             self.groupBoxPreview.setMinimumHeight(240)
         self.setMinimumSize(1024, 640)
         self.resize(1180, 720)
-        style = """
-            QGroupBox {
-                border: 1px solid rgba(120, 120, 120, 0.28);
-                border-radius: 8px;
-                margin-top: 12px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 4px;
-            }
-            QTabWidget::pane {
-                border: 1px solid rgba(120, 120, 120, 0.22);
-                border-radius: 8px;
-            }
-            QTabBar::tab {
-                padding: 6px 12px;
-                margin-right: 4px;
-                border-radius: 8px;
-            }
-            QTabBar::tab:selected {
-                background: rgba(59, 130, 246, 0.16);
-                border-radius: 8px;
-            }
-            QLineEdit, QComboBox, QSpinBox, QDoubleSpinBox, QPlainTextEdit, QTextEdit {
-                padding: 4px 6px;
-                border-radius: 8px;
-            }
-            QComboBox::drop-down {
-                width: 20px;
-                border: none;
-            }
-            QComboBox::down-arrow {
-                width: 8px;
-                height: 8px;
-            }
-            QComboBox QAbstractItemView {
-                border: 1px solid rgba(120, 120, 120, 0.28);
-                border-radius: 8px;
-                padding: 4px;
-                background: palette(base);
-                outline: 0;
-            }
-            QComboBox QListView {
-                border-radius: 8px;
-            }
-            QComboBox QAbstractItemView::viewport {
-                border-radius: 8px;
-                background: palette(base);
-            }
-            QFrame#qt_ComboBox_Popup {
-                border-radius: 8px;
-                border: 1px solid rgba(120, 120, 120, 0.28);
-                background: palette(base);
-            }
-            QFrame#qt_ComboBox_Popup QAbstractItemView {
-                border-radius: 8px;
-                border: none;
-            }
-            QComboBox QAbstractItemView::item {
-                border-radius: 6px;
-                padding: 4px 6px;
-                margin: 2px;
-            }
-            QComboBox QAbstractItemView::item:selected {
-                background: rgba(59, 130, 246, 0.16);
-                border-radius: 6px;
-            }
-            QComboBox QAbstractItemView::item:hover {
-                background: rgba(59, 130, 246, 0.10);
-                border-radius: 6px;
-            }
-            QPushButton {
-                padding: 6px 10px;
-                border-radius: 8px;
-            }
-            QListWidget, QTableWidget, QTreeWidget, QScrollArea, QFrame {
-                border-radius: 8px;
-            }
-            QListWidget::item, QTreeWidget::item, QTableWidget::item {
-                border-radius: 6px;
-                padding: 4px 6px;
-            }
-            QListWidget::item:selected, QTreeWidget::item:selected, QTableWidget::item:selected {
-                background: rgba(59, 130, 246, 0.16);
-                border-radius: 6px;
-            }
-            QProgressBar {
-                border-radius: 8px;
-                text-align: center;
-            }
-            QProgressBar::chunk {
-                border-radius: 8px;
-            }
-            QCheckBox::indicator, QRadioButton::indicator {
-                width: 16px;
-                height: 16px;
-                border-radius: 4px;
-            }
-            QSlider::groove:horizontal {
-                height: 6px;
-                border-radius: 3px;
-            }
-            QSlider::handle:horizontal {
-                width: 14px;
-                margin: -4px 0;
-                border-radius: 7px;
-            }
-            QMessageBox {
-                border-radius: 8px;
-            }
-            QMessageBox QLabel {
-                padding: 2px 0;
-            }
-            QMessageBox QPushButton {
-                min-width: 80px;
-            }
-        """
-        self._style_sheet = style
-        self.setStyleSheet(style)
-        if self._preview_window:
-            self._preview_window.setStyleSheet(style)
+        # The application sheet belongs to qdarktheme, so ours lives on the
+        # window and cascades to its child dialogs and popups from there.
+        self.setStyleSheet(_STYLESHEET)
 
     def _apply_combo_popup_style(self):
+        # Popups are children of their combo and pick up the window sheet's
+        # QComboBox QAbstractItemView rules; only the window flags are per popup.
         for combo in self.findChildren(QComboBox):
             view = combo.view()
             if view is None:
@@ -716,8 +1270,6 @@ class MainWindow(QMainWindow):
                 | Qt.WindowType.FramelessWindowHint
                 | Qt.WindowType.NoDropShadowWindowHint
             )
-            if self._style_sheet:
-                popup.setStyleSheet(self._style_sheet)
 
     def _init_advanced_controls(self):
         self.ui.groupAdvancedPresets = QGroupBox(self.ui.tabAdvanced)
@@ -753,24 +1305,16 @@ class MainWindow(QMainWindow):
         self.ui.btnPresetSave = QPushButton(self.ui.groupBox_2)
         self.ui.btnPresetDelete = QPushButton(self.ui.groupBox_2)
         self.ui.btnPresetReset = QPushButton(self.ui.groupBox_2)
-        preset_layout = QVBoxLayout()
-        preset_layout.setContentsMargins(0, 0, 0, 0)
-        preset_layout.setSpacing(6)
-        preset_row = QHBoxLayout()
-        preset_row.setContentsMargins(0, 0, 0, 0)
-        preset_row.setSpacing(6)
-        preset_row.addWidget(self.ui.cbPresets, 1)
-        button_row = QHBoxLayout()
-        button_row.setContentsMargins(0, 0, 0, 0)
-        button_row.setSpacing(6)
+        button_row = _tight_layout(QHBoxLayout())
         button_row.addStretch()
         button_row.addWidget(self.ui.btnPresetSave)
         button_row.addWidget(self.ui.btnPresetDelete)
         button_row.addWidget(self.ui.btnPresetReset)
-        preset_layout.addLayout(preset_row)
-        preset_layout.addLayout(button_row)
         preset_widget = QWidget(self.ui.groupBox_2)
-        preset_widget.setLayout(preset_layout)
+        # The combo fills the column width on its own; only the buttons need a row
+        preset_layout = _tight_layout(QVBoxLayout(preset_widget))
+        preset_layout.addWidget(self.ui.cbPresets)
+        preset_layout.addLayout(button_row)
         self.ui.advancedPresetLayout.addRow(self.ui.labelPreset, preset_widget)
 
         self.ui.labelNamePrefix = QLabel(self.ui.groupBox_2)
@@ -822,28 +1366,119 @@ class MainWindow(QMainWindow):
 
         self.ui.labelParallelJobs = QLabel(self.ui.groupBox_2)
         self.ui.sbParallelJobs = QSpinBox(self.ui.groupBox_2)
-        self.ui.sbParallelJobs.setRange(1, max(1, (os.cpu_count() or 1)))
+        cpus = _usable_cpus()
+        # Processes compete for cores, so process mode caps the spinbox at the
+        # usable CPU count
+        self._parallel_jobs_limits = {"process": cpus}
+        self.ui.sbParallelJobs.setRange(1, cpus)
         self.ui.advancedPerformanceLayout.addRow(self.ui.labelParallelJobs, self.ui.sbParallelJobs)
 
         self.ui.labelFallbackMode = QLabel(self.ui.groupBox_2)
         self.ui.cbFallbackMode = QComboBox(self.ui.groupBox_2)
         self.ui.advancedPerformanceLayout.addRow(self.ui.labelFallbackMode, self.ui.cbFallbackMode)
 
-        self.ui.leDynamicOffset.setValidator(QDoubleValidator())
-        self.ui.leVADSensitivity.setValidator(QDoubleValidator())
-        self.ui.leVADHangover.setValidator(QRegularExpressionValidator(QRegularExpression(r"\d+")))
+        db_validator = QDoubleValidator(self)
+        db_validator.setLocale(_number_locale())
+        self.ui.leDynamicOffset.setValidator(db_validator)
+        self.ui.leVADSensitivity.setValidator(db_validator)
+        self.ui.leVADHangover.setValidator(self._int_validator)
         self.ui.leDynamicOffset.setText("6")
         self.ui.leVADSensitivity.setText("6")
         self.ui.leVADHangover.setText("120")
         self.ui.cbxDynamicThreshold.setChecked(False)
         self.ui.cbxVAD.setChecked(False)
-        self.ui.sbParallelJobs.setValue(min(4, max(1, (os.cpu_count() or 1))))
+        self.ui.sbParallelJobs.setValue(_PARALLEL_JOBS_DEFAULTS["process"])
+
+        # PresetData field -> (widget setter, value coercer) and (field, widget getter)
+        self._preset_setters = {
+            "threshold": (self.ui.leThreshold.setText, str),
+            "min_length": (self.ui.leMinLen.setText, str),
+            "min_interval": (self.ui.leMinInterval.setText, str),
+            "hop_size": (self.ui.leHopSize.setText, str),
+            "max_silence": (self.ui.leMaxSilence.setText, str),
+            "output_format": (self._set_output_format, str),
+            "name_prefix": (self.ui.leNamePrefix.setText, str),
+            "name_suffix": (self.ui.leNameSuffix.setText, str),
+            "name_timestamp": (self.ui.cbxNameTimestamp.setChecked, bool),
+            "export_csv": (self.ui.cbxExportCsv.setChecked, bool),
+            "export_json": (self.ui.cbxExportJson.setChecked, bool),
+            "dynamic_enabled": (self.ui.cbxDynamicThreshold.setChecked, bool),
+            "dynamic_offset_db": (self.ui.leDynamicOffset.setText, str),
+            "vad_enabled": (self.ui.cbxVAD.setChecked, bool),
+            "vad_sensitivity_db": (self.ui.leVADSensitivity.setText, str),
+            "vad_hangover_ms": (self.ui.leVADHangover.setText, str),
+            "parallel_mode": (functools.partial(self._select_combo_data, self.ui.cbParallelMode), str),
+            "parallel_jobs": (self.ui.sbParallelJobs.setValue, int),
+            "fallback_mode": (functools.partial(self._select_combo_data, self.ui.cbFallbackMode), str),
+        }
+        self._preset_getters = (
+            ("threshold", self.ui.leThreshold.text),
+            ("min_length", self.ui.leMinLen.text),
+            ("min_interval", self.ui.leMinInterval.text),
+            ("hop_size", self.ui.leHopSize.text),
+            ("max_silence", self.ui.leMaxSilence.text),
+            ("output_format", self._get_output_format),
+            ("name_prefix", self.ui.leNamePrefix.text),
+            ("name_suffix", self.ui.leNameSuffix.text),
+            ("name_timestamp", self.ui.cbxNameTimestamp.isChecked),
+            ("export_csv", self.ui.cbxExportCsv.isChecked),
+            ("export_json", self.ui.cbxExportJson.isChecked),
+            ("dynamic_enabled", self.ui.cbxDynamicThreshold.isChecked),
+            ("dynamic_offset_db", self.ui.leDynamicOffset.text),
+            ("vad_enabled", self.ui.cbxVAD.isChecked),
+            ("vad_sensitivity_db", self.ui.leVADSensitivity.text),
+            ("vad_hangover_ms", self.ui.leVADHangover.text),
+            ("parallel_mode", self.ui.cbParallelMode.currentData),
+            ("parallel_jobs", self.ui.sbParallelJobs.value),
+            ("fallback_mode", self.ui.cbFallbackMode.currentData),
+        )
 
-        self._loading_presets = False
         self.ui.btnPresetSave.clicked.connect(self._on_save_preset)
         self.ui.btnPresetDelete.clicked.connect(self._on_delete_preset)
         self.ui.btnPresetReset.clicked.connect(self._on_reset_presets)
         self.ui.cbPresets.currentIndexChanged.connect(self._on_preset_selected)
+        self.ui.cbParallelMode.activated.connect(self._on_parallel_mode_activated)
+        self.ui.cbParallelMode.currentIndexChanged.connect(self._on_parallel_mode_changed)
+
+        # Parsed numeric fields, kept in sync with the line edits so preview and
+        # batch setup do not re-parse text. textChanged also covers setText from
+        # presets and recommendations; unparsable text drops the key, and
+        # _check_numeric_values reports it before anything reads the values.
+        self._numeric_values = {}
+        self._numeric_fields = (
+            ("threshold_db", "threshold", self.ui.leThreshold, float),
+            ("min_length", "min_length", self.ui.leMinLen, int),
+            ("min_interval", "min_interval", self.ui.leMinInterval, int),
+            ("hop_size", "hop_size", self.ui.leHopSize, int),
+            ("max_silence", "max_silence", self.ui.leMaxSilence, int),
+            ("dynamic_offset_db", "dynamic_threshold_offset", self.ui.leDynamicOffset, float),
+            ("vad_sensitivity_db", "vad_sensitivity", self.ui.leVADSensitivity, float),
+            ("vad_hangover_ms", "vad_hangover", self.ui.leVADHangover, int),
+        )
+        for key, _, line_edit, convert in self._numeric_fields:
+            update = functools.partial(self._on_numeric_text_changed, key, convert)
+            line_edit.textChanged.connect(update)
+            update(line_edit.text())
+
+    def _on_numeric_text_changed(self, key: str, convert, text: str):
+        try:
+            self._numeric_values[key] = convert(text)
+        except ValueError:
+            self._numeric_values.pop(key, None)
+
+    def _check_numeric_values(self) -> bool:
+        for key, label_key, line_edit, _ in self._numeric_fields:
+            if key not in self._numeric_values:
+                QMessageBox.warning(
+                    self,
+                    _t("warning_title", self.current_language),
+                    _t("invalid_value", self.current_language).format(
+                        field=_t(label_key, self.current_language)
+                    ),
+                )
+                line_edit.setFocus()
+                return False
+        return True
 
     def _preset_file(self) -> str:
         base_dir = QStandardPaths.writableLocation(QStandardPaths.AppDataLocation)
@@ -854,322 +1489,191 @@ class MainWindow(QMainWindow):
 
     def _load_presets(self):
         self._preset_path = self._preset_file()
-        self._presets: dict[str, dict] = {}
+        self._presets: dict[str, PresetData] = {}
+        self._presets_written = None
         if os.path.exists(self._preset_path):
             try:
-                with open(self._preset_path, "r", encoding="utf-8") as f:
-                    self._presets = json.load(f)
+                with open(self._preset_path, "rb") as f:
+                    raw = _loads_json(f.read())
+                self._presets = {name: PresetData.from_dict(data) for name, data in raw.items()}
             except Exception:
                 self._presets = {}
         if not self._presets:
             self._presets = self._default_presets()
             self._save_presets()
+        self._preset_names = sorted(self._presets)
         self._refresh_preset_combo()
 
-    def _default_presets(self) -> dict:
-        return {
-            "默认（通用）": {
-                "threshold": "-40",
-                "min_length": "5000",
-                "min_interval": "300",
-                "hop_size": "10",
-                "max_silence": "1000",
-                "output_format": "wav",
-                "name_prefix": "",
-                "name_suffix": "",
-                "name_timestamp": False,
-                "export_csv": False,
-                "export_json": False,
-                "dynamic_enabled": True,
-                "dynamic_offset_db": "6",
-                "vad_enabled": True,
-                "vad_sensitivity_db": "6",
-                "vad_hangover_ms": "120",
-                "parallel_mode": "thread",
-                "parallel_jobs": min(4, max(1, (os.cpu_count() or 1))),
-                "fallback_mode": "ffmpeg_then_librosa",
-            },
-            "人声（保守）": {
-                "threshold": "-45",
-                "min_length": "6000",
-                "min_interval": "400",
-                "hop_size": "10",
-                "max_silence": "1500",
-                "output_format": "wav",
-                "name_prefix": "",
-                "name_suffix": "",
-                "name_timestamp": False,
-                "export_csv": False,
-                "export_json": False,
-                "dynamic_enabled": True,
-                "dynamic_offset_db": "5",
-                "vad_enabled": True,
-                "vad_sensitivity_db": "7",
-                "vad_hangover_ms": "180",
-                "parallel_mode": "thread",
-                "parallel_jobs": min(4, max(1, (os.cpu_count() or 1))),
-                "fallback_mode": "ffmpeg_then_librosa",
-            },
-            "人声（激进）": {
-                "threshold": "-35",
-                "min_length": "3000",
-                "min_interval": "200",
-                "hop_size": "10",
-                "max_silence": "600",
-                "output_format": "wav",
-                "name_prefix": "",
-                "name_suffix": "",
-                "name_timestamp": False,
-                "export_csv": False,
-                "export_json": False,
-                "dynamic_enabled": True,
-                "dynamic_offset_db": "7",
-                "vad_enabled": True,
-                "vad_sensitivity_db": "5",
-                "vad_hangover_ms": "80",
-                "parallel_mode": "thread",
-                "parallel_jobs": min(4, max(1, (os.cpu_count() or 1))),
-                "fallback_mode": "ffmpeg_then_librosa",
-            },
-            "长音频": {
-                "threshold": "-40",
-                "min_length": "8000",
-                "min_interval": "500",
-                "hop_size": "20",
-                "max_silence": "2000",
-                "output_format": "flac",
-                "name_prefix": "",
-                "name_suffix": "",
-                "name_timestamp": True,
-                "export_csv": True,
-                "export_json": False,
-                "dynamic_enabled": True,
-                "dynamic_offset_db": "6",
-                "vad_enabled": True,
-                "vad_sensitivity_db": "6",
-                "vad_hangover_ms": "200",
-                "parallel_mode": "thread",
-                "parallel_jobs": min(4, max(1, (os.cpu_count() or 1))),
-                "fallback_mode": "ffmpeg_then_librosa",
-            },
-            "播客/对白": {
-                "threshold": "-42",
-                "min_length": "4000",
-                "min_interval": "250",
-                "hop_size": "10",
-                "max_silence": "1200",
-                "output_format": "wav",
-                "name_prefix": "",
-                "name_suffix": "",
-                "name_timestamp": False,
-                "export_csv": True,
-                "export_json": True,
-                "dynamic_enabled": True,
-                "dynamic_offset_db": "6",
-                "vad_enabled": True,
-                "vad_sensitivity_db": "6",
-                "vad_hangover_ms": "150",
-                "parallel_mode": "thread",
-                "parallel_jobs": min(4, max(1, (os.cpu_count() or 1))),
-                "fallback_mode": "ffmpeg_then_librosa",
-            },
-        }
+    def _default_presets(self) -> dict[str, PresetData]:
+        return {name: PresetData.from_dict(values) for name, values in _DEFAULT_PRESETS.items()}
+
+    def _schedule_preset_save(self):
+        self._preset_save_timer.start()
+
+    def _flush_presets(self):
+        if self._preset_save_timer.isActive():
+            self._preset_save_timer.stop()
+            self._save_presets()
+        if self._preset_writer is not None:
+            self._preset_writer.shutdown(wait=True)
+            self._preset_writer = None
 
     def _save_presets(self):
-        with open(self._preset_path, "w", encoding="utf-8") as f:
-            json.dump(self._presets, f, ensure_ascii=False, indent=2)
+        data = _dumps_json({name: preset.to_dict() for name, preset in self._presets.items()})
+        if data == self._presets_written:
+            return
+        self._presets_written = data
+        # Serialized here, written off the GUI thread so a slow disk never stalls
+        # the event loop; a single writer keeps the saves in order
+        if self._preset_writer is None:
+            self._preset_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="presets")
+        self._preset_writer.submit(self._write_presets, self._preset_path, data)
+
+    def _write_presets(self, path: str, data: bytes):
+        # Runs on the writer thread. Write to a sibling file and swap it in so
+        # a crash never leaves a torn file.
+        temp_path = path + ".tmp"
+        try:
+            with open(temp_path, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        except OSError:
+            QMetaObject.invokeMethod(self, "_on_preset_write_failed", Qt.QueuedConnection)
+            raise
+
+    @Slot()
+    def _on_preset_write_failed(self):
+        # Let the next save retry instead of matching bytes never written
+        self._presets_written = None
 
     def _refresh_preset_combo(self, selected_name: str | None = None):
         current_name = selected_name or self.ui.cbPresets.currentText()
-        self._loading_presets = True
-        self.ui.cbPresets.clear()
-        self.ui.cbPresets.addItem(i18n.text("preset_select", self.current_language))
-        for name in sorted(self._presets.keys()):
-            self.ui.cbPresets.addItem(name)
-        if current_name in self._presets:
-            idx = self.ui.cbPresets.findText(current_name)
-            if idx >= 0:
-                self.ui.cbPresets.setCurrentIndex(idx)
-        else:
-            self.ui.cbPresets.setCurrentIndex(0)
-        self._loading_presets = False
-
-    def _collect_preset(self) -> dict:
-        return {
-            "threshold": self.ui.leThreshold.text(),
-            "min_length": self.ui.leMinLen.text(),
-            "min_interval": self.ui.leMinInterval.text(),
-            "hop_size": self.ui.leHopSize.text(),
-            "max_silence": self.ui.leMaxSilence.text(),
-            "output_format": self._get_output_format(),
-            "name_prefix": self.ui.leNamePrefix.text(),
-            "name_suffix": self.ui.leNameSuffix.text(),
-            "name_timestamp": self.ui.cbxNameTimestamp.isChecked(),
-            "export_csv": self.ui.cbxExportCsv.isChecked(),
-            "export_json": self.ui.cbxExportJson.isChecked(),
-            "dynamic_enabled": self.ui.cbxDynamicThreshold.isChecked(),
-            "dynamic_offset_db": self.ui.leDynamicOffset.text(),
-            "vad_enabled": self.ui.cbxVAD.isChecked(),
-            "vad_sensitivity_db": self.ui.leVADSensitivity.text(),
-            "vad_hangover_ms": self.ui.leVADHangover.text(),
-            "parallel_mode": self.ui.cbParallelMode.currentData(),
-            "parallel_jobs": self.ui.sbParallelJobs.value(),
-            "fallback_mode": self.ui.cbFallbackMode.currentData(),
-        }
+        # Rebuilding must not apply a preset, so the combo emits nothing meanwhile
+        self.ui.cbPresets.blockSignals(True)
+        self.ui.cbPresets.setUpdatesEnabled(False)
+        try:
+            self.ui.cbPresets.clear()
+            # One model insertion for the whole list rather than one per preset
+            self.ui.cbPresets.addItems([_t("preset_select", self.current_language), *self._preset_names])
+            if current_name in self._presets:
+                idx = self.ui.cbPresets.findText(current_name)
+                if idx >= 0:
+                    self.ui.cbPresets.setCurrentIndex(idx)
+            else:
+                self.ui.cbPresets.setCurrentIndex(0)
+        finally:
+            self.ui.cbPresets.setUpdatesEnabled(True)
+            self.ui.cbPresets.blockSignals(False)
+
+    def _collect_preset(self) -> PresetData:
+        return PresetData(**{key: getter() for key, getter in self._preset_getters})
+
+    def _apply_preset(self, preset: PresetData):
+        for key, (setter, coerce) in self._preset_setters.items():
+            value = getattr(preset, key)
+            if value is not None:
+                setter(coerce(value))
+
+    def _set_output_format(self, output_format: str):
+        for btn in self.ui.outputFormatGroup.buttons():
+            if btn.text() == output_format:
+                btn.setChecked(True)
+                break
 
-    def _apply_preset(self, data: dict):
-        if not data:
-            return
-        if "threshold" in data:
-            self.ui.leThreshold.setText(str(data["threshold"]))
-        if "min_length" in data:
-            self.ui.leMinLen.setText(str(data["min_length"]))
-        if "min_interval" in data:
-            self.ui.leMinInterval.setText(str(data["min_interval"]))
-        if "hop_size" in data:
-            self.ui.leHopSize.setText(str(data["hop_size"]))
-        if "max_silence" in data:
-            self.ui.leMaxSilence.setText(str(data["max_silence"]))
-        if "output_format" in data:
-            for btn in self.ui.outputFormatGroup.buttons():
-                if btn.text() == data["output_format"]:
-                    btn.setChecked(True)
-                    break
-        if "name_prefix" in data:
-            self.ui.leNamePrefix.setText(str(data["name_prefix"]))
-        if "name_suffix" in data:
-            self.ui.leNameSuffix.setText(str(data["name_suffix"]))
-        if "name_timestamp" in data:
-            self.ui.cbxNameTimestamp.setChecked(bool(data["name_timestamp"]))
-        if "export_csv" in data:
-            self.ui.cbxExportCsv.setChecked(bool(data["export_csv"]))
-        if "export_json" in data:
-            self.ui.cbxExportJson.setChecked(bool(data["export_json"]))
-        if "dynamic_enabled" in data:
-            self.ui.cbxDynamicThreshold.setChecked(bool(data["dynamic_enabled"]))
-        if "dynamic_offset_db" in data:
-            self.ui.leDynamicOffset.setText(str(data["dynamic_offset_db"]))
-        if "vad_enabled" in data:
-            self.ui.cbxVAD.setChecked(bool(data["vad_enabled"]))
-        if "vad_sensitivity_db" in data:
-            self.ui.leVADSensitivity.setText(str(data["vad_sensitivity_db"]))
-        if "vad_hangover_ms" in data:
-            self.ui.leVADHangover.setText(str(data["vad_hangover_ms"]))
-        if "parallel_mode" in data:
-            idx = self.ui.cbParallelMode.findData(data["parallel_mode"])
-            if idx >= 0:
-                self.ui.cbParallelMode.setCurrentIndex(idx)
-        if "parallel_jobs" in data:
-            self.ui.sbParallelJobs.setValue(int(data["parallel_jobs"]))
-        if "fallback_mode" in data:
-            idx = self.ui.cbFallbackMode.findData(data["fallback_mode"])
-            if idx >= 0:
-                self.ui.cbFallbackMode.setCurrentIndex(idx)
+    def _select_combo_data(self, combo: QComboBox, value):
+        idx = combo.findData(value)
+        if idx >= 0:
+            combo.setCurrentIndex(idx)
 
     def _on_save_preset(self):
         name, ok = QInputDialog.getText(
             self,
-            i18n.text("preset_save_title", self.current_language),
-            i18n.text("preset_save_prompt", self.current_language),
+            _t("preset_save_title", self.current_language),
+            _t("preset_save_prompt", self.current_language),
         )
         if not ok or not name:
             return
+        if name not in self._presets:
+            bisect.insort(self._preset_names, name)
         self._presets[name] = self._collect_preset()
-        self._save_presets()
+        self._schedule_preset_save()
         self._refresh_preset_combo(name)
 
     def _on_delete_preset(self):
         name = self.ui.cbPresets.currentText()
         if name in self._presets:
             del self._presets[name]
-            self._save_presets()
+            del self._preset_names[bisect.bisect_left(self._preset_names, name)]
+            self._schedule_preset_save()
             self._refresh_preset_combo()
 
     def _on_reset_presets(self):
         ret = QMessageBox.question(
             self,
-            i18n.text("preset_reset_title", self.current_language),
-            i18n.text("preset_reset_confirm", self.current_language),
+            _t("preset_reset_title", self.current_language),
+            _t("preset_reset_confirm", self.current_language),
             QMessageBox.Yes | QMessageBox.No,
             QMessageBox.No,
         )
         if ret != QMessageBox.Yes:
             return
         self._presets = self._default_presets()
-        self._save_presets()
+        self._preset_names = sorted(self._presets)
+        self._schedule_preset_save()
         selected = next(iter(self._presets.keys()), None)
         self._refresh_preset_combo(selected)
         if selected:
             self._apply_preset(self._presets[selected])
         QMessageBox.information(
             self,
-            i18n.text("preset_reset_done_title", self.current_language),
-            i18n.text("preset_reset_done", self.current_language),
+            _t("preset_reset_done_title", self.current_language),
+            _t("preset_reset_done", self.current_language),
         )
 
     def _on_preset_selected(self, index: int):
-        if self._loading_presets:
-            return
         name = self.ui.cbPresets.currentText()
         if name in self._presets:
             self._apply_preset(self._presets[name])
 
     def _init_language_selector(self):
-        self.ui.cbLanguage.clear()
-        for code, label in i18n.LANGUAGES.items():
-            self.ui.cbLanguage.addItem(label, code)
-        idx = self.ui.cbLanguage.findData(self.current_language)
+        combo = self.ui.cbLanguage
+        combo.blockSignals(True)
+        combo.clear()
+        for code, label in _LANGUAGE_ITEMS:
+            combo.addItem(label, code)
+        idx = combo.findData(self.current_language)
         if idx >= 0:
-            self.ui.cbLanguage.setCurrentIndex(idx)
-        self.ui.cbLanguage.currentIndexChanged.connect(self._on_language_changed)
+            combo.setCurrentIndex(idx)
+        combo.blockSignals(False)
+        combo.currentIndexChanged.connect(self._on_language_changed)
 
     def _refresh_parallel_mode_options(self):
-        current = self.ui.cbParallelMode.currentData()
-        self.ui.cbParallelMode.clear()
-        self.ui.cbParallelMode.addItem(
-            i18n.text("parallel_mode_single", self.current_language),
-            "single",
-        )
-        self.ui.cbParallelMode.addItem(
-            i18n.text("parallel_mode_thread", self.current_language),
-            "thread",
-        )
-        self.ui.cbParallelMode.addItem(
-            i18n.text("parallel_mode_process", self.current_language),
-            "process",
-        )
-        if current is not None:
-            idx = self.ui.cbParallelMode.findData(current)
-            if idx >= 0:
-                self.ui.cbParallelMode.setCurrentIndex(idx)
+        self._retranslate_combo(self.ui.cbParallelMode, _PARALLEL_MODE_ITEMS)
 
     def _refresh_fallback_mode_options(self):
-        current = self.ui.cbFallbackMode.currentData()
-        self.ui.cbFallbackMode.clear()
-        self.ui.cbFallbackMode.addItem(
-            i18n.text("fallback_mode_ask", self.current_language),
-            "ask",
-        )
-        self.ui.cbFallbackMode.addItem(
-            i18n.text("fallback_mode_ffmpeg_then_librosa", self.current_language),
-            "ffmpeg_then_librosa",
-        )
-        self.ui.cbFallbackMode.addItem(
-            i18n.text("fallback_mode_ffmpeg", self.current_language),
-            "ffmpeg",
-        )
-        self.ui.cbFallbackMode.addItem(
-            i18n.text("fallback_mode_librosa", self.current_language),
-            "librosa",
-        )
-        self.ui.cbFallbackMode.addItem(
-            i18n.text("fallback_mode_skip", self.current_language),
-            "skip",
-        )
-        if current is not None:
-            idx = self.ui.cbFallbackMode.findData(current)
-            if idx >= 0:
-                self.ui.cbFallbackMode.setCurrentIndex(idx)
+        self._retranslate_combo(self.ui.cbFallbackMode, _FALLBACK_MODE_ITEMS)
+
+    def _retranslate_combo(self, combo: QComboBox, items):
+        # Items are created once; later language switches only swap their text,
+        # which keeps the current selection without a clear/findData round-trip.
+        if combo.count() != len(items):
+            combo.blockSignals(True)
+            combo.clear()
+            for data, key in items:
+                combo.addItem(_t(key, self.current_language), data)
+            combo.blockSignals(False)
+            return
+        for i, (_, key) in enumerate(items):
+            combo.setItemText(i, _t(key, self.current_language))
+
+    def _on_parallel_mode_activated(self, index: int):
+        jobs = _PARALLEL_JOBS_DEFAULTS.get(self.ui.cbParallelMode.itemData(index))
+        if jobs is not None:
+            self.ui.sbParallelJobs.setValue(jobs)
+
+    def _on_parallel_mode_changed(self, index: int):
+        mode = self.ui.cbParallelMode.itemData(index)
+        self.ui.sbParallelJobs.setMaximum(self._parallel_jobs_limits.get(mode, 2 * _usable_cpus()))
 
     def _on_language_changed(self, index: int):
         code = self.ui.cbLanguage.itemData(index)
@@ -1177,66 +1681,76 @@ class MainWindow(QMainWindow):
             self.current_language = code
             self._apply_language()
 
+    def _init_language_bindings(self):
+        # (setter, i18n key) pairs re-applied on every language change
+        self._i18n_bindings = [
+            (self.setWindowTitle, "window_title"),
+            (self.ui.btnAddFiles.setText, "add_files"),
+            (self.ui.btnAbout.setText, "about"),
+            (self.ui.groupBox.setTitle, "task_list"),
+            (self.ui.btnRemove.setText, "remove"),
+            (self.ui.btnClearList.setText, "clear_list"),
+            (self.ui.groupBox_2.setTitle, "settings"),
+            (self.ui.label_2.setText, "threshold"),
+            (self.ui.label_3.setText, "min_length"),
+            (self.ui.label_4.setText, "min_interval"),
+            (self.ui.label_5.setText, "hop_size"),
+            (self.ui.label_6.setText, "max_silence"),
+            (self.ui.labelLanguage.setText, "language"),
+            (self.ui.btnPreviewSelection.setText, "preview_selection"),
+            (self.ui.label_7.setText, "output_directory"),
+            (self.ui.btnBrowse.setText, "browse"),
+            (self.ui.labelOutputFormat.setText, "output_format"),
+            (self.ui.cbxOpenOutuptDirectory.setText, "open_output_directory"),
+            (self.ui.labelPreset.setText, "presets"),
+            (self.ui.btnPresetSave.setText, "preset_save"),
+            (self.ui.btnPresetDelete.setText, "preset_delete"),
+            (self.ui.btnPresetReset.setText, "preset_reset"),
+            (self.ui.labelNamePrefix.setText, "name_prefix"),
+            (self.ui.labelNameSuffix.setText, "name_suffix"),
+            (self.ui.labelNameTimestamp.setText, "name_timestamp"),
+            (self.ui.labelExportCsv.setText, "export_csv"),
+            (self.ui.labelExportJson.setText, "export_json"),
+            (self.ui.labelDynamicThreshold.setText, "dynamic_threshold"),
+            (self.ui.labelDynamicOffset.setText, "dynamic_threshold_offset"),
+            (self.ui.labelVAD.setText, "vad"),
+            (self.ui.labelVADSensitivity.setText, "vad_sensitivity"),
+            (self.ui.labelVADHangover.setText, "vad_hangover"),
+            (self.ui.labelParallelMode.setText, "parallel_mode"),
+            (self.ui.labelParallelJobs.setText, "parallel_jobs"),
+            (self.ui.labelFallbackMode.setText, "fallback_mode"),
+            (functools.partial(self.ui.settingsTabs.setTabText, 0), "settings_basic"),
+            (functools.partial(self.ui.settingsTabs.setTabText, 1), "settings_advanced"),
+            (self.ui.labelRecommend.setText, "recommend_label"),
+            (self.ui.btnRecommend.setText, "recommend_button"),
+            (self.ui.groupAdvancedPresets.setTitle, "advanced_group_presets"),
+            (self.ui.groupAdvancedNaming.setTitle, "advanced_group_naming"),
+            (self.ui.groupAdvancedDetection.setTitle, "advanced_group_detection"),
+            (self.ui.groupAdvancedPerformance.setTitle, "advanced_group_performance"),
+        ]
+
     def _apply_language(self):
-        self.setWindowTitle(i18n.text("window_title", self.current_language))
-        self.ui.btnAddFiles.setText(i18n.text("add_files", self.current_language))
-        self.ui.btnAbout.setText(i18n.text("about", self.current_language))
-        self.ui.groupBox.setTitle(i18n.text("task_list", self.current_language))
-        self.ui.btnRemove.setText(i18n.text("remove", self.current_language))
-        self.ui.btnClearList.setText(i18n.text("clear_list", self.current_language))
-        self.ui.groupBox_2.setTitle(i18n.text("settings", self.current_language))
-        self.ui.label_2.setText(i18n.text("threshold", self.current_language))
-        self.ui.label_3.setText(i18n.text("min_length", self.current_language))
-        self.ui.label_4.setText(i18n.text("min_interval", self.current_language))
-        self.ui.label_5.setText(i18n.text("hop_size", self.current_language))
-        self.ui.label_6.setText(i18n.text("max_silence", self.current_language))
-        self.ui.labelLanguage.setText(i18n.text("language", self.current_language))
-        self.ui.btnPreviewSelection.setText(i18n.text("preview_selection", self.current_language))
-        self.ui.label_7.setText(i18n.text("output_directory", self.current_language))
-        self.ui.btnBrowse.setText(i18n.text("browse", self.current_language))
-        self.ui.labelOutputFormat.setText(i18n.text("output_format", self.current_language))
-        self.ui.cbxOpenOutuptDirectory.setText(i18n.text("open_output_directory", self.current_language))
-        self.ui.btnStart.setText(
-            i18n.text("slicing", self.current_language) if self.processing else i18n.text("start", self.current_language)
-        )
-        if self._preview_embed and self.groupBoxPreview:
-            self.groupBoxPreview.setTitle(i18n.text("preview", self.current_language))
-            if self._preview_pixmap_path:
-                self._update_preview_pixmap()
-            else:
-                self.labelPreview.setText(i18n.text("preview_placeholder", self.current_language))
-        if self._preview_window:
-            self._preview_window.setWindowTitle(i18n.text("preview", self.current_language))
-        if self._preview_zoom_label:
-            self._preview_zoom_label.setText(i18n.text("preview_zoom", self.current_language))
-        self.ui.labelPreset.setText(i18n.text("presets", self.current_language))
-        self.ui.btnPresetSave.setText(i18n.text("preset_save", self.current_language))
-        self.ui.btnPresetDelete.setText(i18n.text("preset_delete", self.current_language))
-        self.ui.btnPresetReset.setText(i18n.text("preset_reset", self.current_language))
-        self.ui.labelNamePrefix.setText(i18n.text("name_prefix", self.current_language))
-        self.ui.labelNameSuffix.setText(i18n.text("name_suffix", self.current_language))
-        self.ui.labelNameTimestamp.setText(i18n.text("name_timestamp", self.current_language))
-        self.ui.labelExportCsv.setText(i18n.text("export_csv", self.current_language))
-        self.ui.labelExportJson.setText(i18n.text("export_json", self.current_language))
-        self.ui.labelDynamicThreshold.setText(i18n.text("dynamic_threshold", self.current_language))
-        self.ui.labelDynamicOffset.setText(i18n.text("dynamic_threshold_offset", self.current_language))
-        self.ui.labelVAD.setText(i18n.text("vad", self.current_language))
-        self.ui.labelVADSensitivity.setText(i18n.text("vad_sensitivity", self.current_language))
-        self.ui.labelVADHangover.setText(i18n.text("vad_hangover", self.current_language))
-        self.ui.labelParallelMode.setText(i18n.text("parallel_mode", self.current_language))
-        self.ui.labelParallelJobs.setText(i18n.text("parallel_jobs", self.current_language))
-        self.ui.labelFallbackMode.setText(i18n.text("fallback_mode", self.current_language))
-        self.ui.settingsTabs.setTabText(0, i18n.text("settings_basic", self.current_language))
-        self.ui.settingsTabs.setTabText(1, i18n.text("settings_advanced", self.current_language))
-        self.ui.labelRecommend.setText(i18n.text("recommend_label", self.current_language))
-        self.ui.btnRecommend.setText(i18n.text("recommend_button", self.current_language))
-        self.ui.groupAdvancedPresets.setTitle(i18n.text("advanced_group_presets", self.current_language))
-        self.ui.groupAdvancedNaming.setTitle(i18n.text("advanced_group_naming", self.current_language))
-        self.ui.groupAdvancedDetection.setTitle(i18n.text("advanced_group_detection", self.current_language))
-        self.ui.groupAdvancedPerformance.setTitle(i18n.text("advanced_group_performance", self.current_language))
-        self._refresh_parallel_mode_options()
-        self._refresh_fallback_mode_options()
-        self._refresh_preset_combo(self.ui.cbPresets.currentText())
+        lang = self.current_language
+        # One repaint for the whole pass instead of one per relabelled widget
+        self.setUpdatesEnabled(False)
+        try:
+            for setter, key in self._i18n_bindings:
+                setter(_t(key, lang))
+            self.ui.btnStart.setText(_t("slicing", lang) if self.processing else _t("start", lang))
+            if self._preview_embed and self.groupBoxPreview:
+                self.groupBoxPreview.setTitle(_t("preview", lang))
+                # The rendered preview is language-independent; only the placeholder needs text
+                if self._preview_source_pixmap is None:
+                    self.labelPreview.setText(_t("preview_placeholder", lang))
+            if self._preview_window:
+                self._preview_window.setWindowTitle(_t("preview", lang))
+            if self._preview_zoom_label:
+                self._preview_zoom_label.setText(_t("preview_zoom", lang))
+            self._refresh_parallel_mode_options()
+            self._refresh_fallback_mode_options()
+            self._refresh_preset_combo(self.ui.cbPresets.currentText())
+        finally:
+            self.setUpdatesEnabled(True)
 
     def _get_output_format(self) -> str:
         checked = self.ui.outputFormatGroup.checkedButton()
@@ -1244,58 +1758,94 @@ class MainWindow(QMainWindow):
             return "wav"
         return checked.text()
 
-    def _collect_processing_options(self) -> dict:
+    def _collect_processing_options(self) -> ProcessingOptions:
+        # "thread" mode pays off only when libsndfile (or the ffmpeg subprocess)
+        # can decode the files; anything that needs librosa belongs in "process".
+        return ProcessingOptions(
+            threshold_db=self._numeric_values["threshold_db"],
+            min_length=self._numeric_values["min_length"],
+            min_interval=self._numeric_values["min_interval"],
+            hop_size=self._numeric_values["hop_size"],
+            max_silence=self._numeric_values["max_silence"],
+            dynamic_enabled=self.ui.cbxDynamicThreshold.isChecked(),
+            dynamic_offset_db=self._numeric_values["dynamic_offset_db"],
+            vad_enabled=self.ui.cbxVAD.isChecked(),
+            vad_sensitivity_db=self._numeric_values["vad_sensitivity_db"],
+            vad_hangover_ms=self._numeric_values["vad_hangover_ms"],
+            parallel_mode=self.ui.cbParallelMode.currentData() or "process",
+            parallel_jobs=int(self.ui.sbParallelJobs.value()),
+            fallback_mode=self.ui.cbFallbackMode.currentData() or "ask",
+            name_prefix=self.ui.leNamePrefix.text(),
+            name_suffix=self.ui.leNameSuffix.text(),
+            name_timestamp=self.ui.cbxNameTimestamp.isChecked(),
+            export_csv=self.ui.cbxExportCsv.isChecked(),
+            export_json=self.ui.cbxExportJson.isChecked(),
+            output_dir=self.ui.leOutputDir.text() or None,
+        )
+
+    def _collect_process_kwargs(self, options: ProcessingOptions, output_ext: str) -> dict:
         return {
-            "threshold_db": float(self.ui.leThreshold.text()),
-            "min_length": int(self.ui.leMinLen.text()),
-            "min_interval": int(self.ui.leMinInterval.text()),
-            "hop_size": int(self.ui.leHopSize.text()),
-            "max_silence": int(self.ui.leMaxSilence.text()),
-            "dynamic_enabled": self.ui.cbxDynamicThreshold.isChecked(),
-            "dynamic_offset_db": float(self.ui.leDynamicOffset.text()),
-            "vad_enabled": self.ui.cbxVAD.isChecked(),
-            "vad_sensitivity_db": float(self.ui.leVADSensitivity.text()),
-            "vad_hangover_ms": int(self.ui.leVADHangover.text()),
-            "parallel_mode": self.ui.cbParallelMode.currentData() or "single",
-            "parallel_jobs": int(self.ui.sbParallelJobs.value()),
-            "fallback_mode": self.ui.cbFallbackMode.currentData() or "ask",
-            "name_prefix": self.ui.leNamePrefix.text(),
-            "name_suffix": self.ui.leNameSuffix.text(),
-            "name_timestamp": self.ui.cbxNameTimestamp.isChecked(),
-            "export_csv": self.ui.cbxExportCsv.isChecked(),
-            "export_json": self.ui.cbxExportJson.isChecked(),
-            "output_dir": self.ui.leOutputDir.text() or None,
+            "output_ext": output_ext,
+            "threshold_db": options.threshold_db,
+            "min_length": options.min_length,
+            "min_interval": options.min_interval,
+            "hop_size": options.hop_size,
+            "max_silence": options.max_silence,
+            "dynamic_enabled": options.dynamic_enabled,
+            "dynamic_offset_db": options.dynamic_offset_db,
+            "vad_enabled": options.vad_enabled,
+            "vad_sensitivity_db": options.vad_sensitivity_db,
+            "vad_hangover_ms": options.vad_hangover_ms,
+            "name_prefix": options.name_prefix,
+            "name_suffix": options.name_suffix,
+            "name_timestamp": options.name_timestamp,
+            "export_csv": options.export_csv,
+            "export_json": options.export_json,
+            "output_dir": options.output_dir,
+            "fallback_mode": options.fallback_mode,
+            "language": self.current_language,
         }
 
     def _get_theme(self) -> str:
-        color = self.palette().color(QPalette.Window)
-        return "dark" if color.value() < 128 else "light"
+        if self._theme is None:
+            color = self.palette().color(QPalette.Window)
+            self._theme = "dark" if color.value() < 128 else "light"
+        return self._theme
+
+    def _collect_analysis_options(self) -> SliceAnalysisOptions:
+        from audio_slicer.utils.slicer2 import vad_hangover_frames
+
+        return SliceAnalysisOptions(
+            dynamic_enabled=self.ui.cbxDynamicThreshold.isChecked(),
+            dynamic_offset_db=self._numeric_values["dynamic_offset_db"],
+            vad_enabled=self.ui.cbxVAD.isChecked(),
+            vad_sensitivity_db=self._numeric_values["vad_sensitivity_db"],
+            hangover_frames=vad_hangover_frames(
+                self._numeric_values["vad_hangover_ms"],
+                self._numeric_values["hop_size"],
+            ),
+        )
+
+    def _build_slice_analysis(self, slicer: Slicer, audio: np.ndarray, opts: SliceAnalysisOptions):
+        from audio_slicer.utils.slicer2 import estimate_dynamic_threshold_db, build_vad_mask
 
-    def _build_slice_analysis(self, slicer: Slicer, audio: np.ndarray):
-        dynamic_enabled = self.ui.cbxDynamicThreshold.isChecked()
-        vad_enabled = self.ui.cbxVAD.isChecked()
         rms_list = None
-        if dynamic_enabled or vad_enabled:
+        if opts.dynamic_enabled or opts.vad_enabled:
             rms_list = slicer.get_rms_list(audio)
         dynamic_threshold_db = None
-        if dynamic_enabled and rms_list is not None:
+        if opts.dynamic_enabled and rms_list is not None:
             dynamic_threshold_db = estimate_dynamic_threshold_db(
                 rms_list,
-                offset_db=float(self.ui.leDynamicOffset.text()),
+                offset_db=opts.dynamic_offset_db,
             )
         vad_mask = None
-        if vad_enabled and rms_list is not None:
+        if opts.vad_enabled and rms_list is not None:
             base_threshold = dynamic_threshold_db if dynamic_threshold_db is not None else slicer.threshold_db
-            hangover_ms = int(self.ui.leVADHangover.text())
-            hop_ms = int(self.ui.leHopSize.text())
-            hangover_frames = 0
-            if hop_ms > 0 and hangover_ms > 0:
-                hangover_frames = max(1, int(round(hangover_ms / hop_ms)))
             vad_mask = build_vad_mask(
                 rms_list,
                 threshold_db=base_threshold,
-                sensitivity_db=float(self.ui.leVADSensitivity.text()),
-                hangover_frames=hangover_frames,
+                sensitivity_db=opts.vad_sensitivity_db,
+                hangover_frames=opts.hangover_frames,
             )
         return rms_list, dynamic_threshold_db, vad_mask
 
@@ -1310,25 +1860,69 @@ class MainWindow(QMainWindow):
             QMessageBox.information(
                 self,
                 QApplication.applicationName(),
-                i18n.text("recommend_no_selection", self.current_language),
+                _t("recommend_no_selection", self.current_language),
             )
             return
         filename = item.data(Qt.ItemDataRole.UserRole + 1)
         if not filename:
             return
-        audio, sr = self._read_audio_for_analysis(filename)
-        if audio is None or sr is None:
+        if self._recommend_thread is not None and self._recommend_thread.isRunning():
+            return
+        # Re-clicking on an unchanged file skips the decode and analysis
+        try:
+            stat = os.stat(filename)
+            cache_key = (filename, stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            cache_key = None
+        rec = self._recommend_cache.get(cache_key)
+        if rec is not None:
+            self._present_recommendations(rec)
+            return
+        self._start_recommend(filename, cache_key, "soundfile")
+
+    def _start_recommend(self, filename: str, cache_key: tuple | None, decoder: str):
+        thread = RecommendThread(filename, self, decoder, self._last_decode)
+        thread.recommended.connect(functools.partial(self._on_recommended, cache_key))
+        thread.readFailed.connect(functools.partial(self._on_recommend_read_failed, filename, cache_key))
+        if self._recommend_thread is not None:
+            # Already past run() by now; this only reaps the thread object
+            self._recommend_thread.wait()
+        self._recommend_thread = thread
+        self.ui.btnRecommend.setEnabled(False)
+        thread.start()
+
+    def _on_recommend_read_failed(self, filename: str, cache_key: tuple | None, error: str):
+        choice = self._show_fallback_dialog("process_read_failed", filename, error)
+        if choice in ("ffmpeg", "librosa"):
+            self._start_recommend(filename, cache_key, choice)
+        else:
+            self._on_recommended(cache_key, (None, None))
+
+    def _on_recommended(self, cache_key: tuple | None, result: tuple):
+        rec, decode = result
+        self.ui.btnRecommend.setEnabled(not self.processing)
+        if decode is not None:
+            self._keep_decode(decode)
+        if rec is None:
             QMessageBox.warning(
                 self,
-                i18n.text("warning_title", self.current_language),
-                i18n.text("recommend_failed", self.current_language),
+                _t("warning_title", self.current_language),
+                _t("recommend_failed", self.current_language),
             )
             return
-        rec = self._compute_recommendations(audio, sr)
+        if cache_key is not None:
+            if len(self._recommend_cache) >= 32:
+                self._recommend_cache.pop(next(iter(self._recommend_cache)))
+            self._recommend_cache[cache_key] = rec
+        self._present_recommendations(rec)
+
+    def _present_recommendations(self, rec: dict):
+        # Depends on the task list rather than the file, so never cached
+        rec = {**rec, "parallel_mode": "process" if self.ui.lwTaskList.count() > 1 else "single"}
         msg = self._format_recommend_message(rec)
         ret = QMessageBox.question(
             self,
-            i18n.text("recommend_title", self.current_language),
+            _t("recommend_title", self.current_language),
             msg,
             QMessageBox.Yes | QMessageBox.No,
             QMessageBox.Yes,
@@ -1337,52 +1931,16 @@ class MainWindow(QMainWindow):
             return
         self._apply_recommendations(rec)
 
-    def _read_audio_for_analysis(self, filename: str):
-        try:
-            audio, sr = soundfile.read(filename, dtype=np.float32)
-            return audio, sr
-        except Exception as exc:
-            choice = self._show_fallback_dialog("process_read_failed", filename, str(exc))
-            if choice == "ffmpeg":
-                return self._read_audio_with_ffmpeg(filename)
-            if choice == "librosa":
-                return self._read_audio_with_librosa(filename)
-        return None, None
-
     def _read_audio_with_ffmpeg(self, filename: str):
-        ffmpeg_path = resolve_ffmpeg_path()
+        from audio_slicer.utils.processing import decode_with_ffmpeg
+
+        ffmpeg_path = _ffmpeg_path()
         if not ffmpeg_path:
             return None, None
-        with tempfile.NamedTemporaryFile(
-            prefix="audio_slicer_recommend_",
-            suffix=".wav",
-            delete=False,
-        ) as tmp:
-            temp_path = tmp.name
-        try:
-            result = subprocess.run(
-                [
-                    ffmpeg_path,
-                    "-y",
-                    "-i",
-                    filename,
-                    "-vn",
-                    "-acodec",
-                    "pcm_s16le",
-                    temp_path,
-                ],
-                capture_output=True,
-                text=True,
-            )
-            if result.returncode != 0:
-                return None, None
-            audio, sr = soundfile.read(temp_path, dtype=np.float32)
-            return audio, sr
-        finally:
-            try:
-                os.remove(temp_path)
-            except OSError:
-                pass
+        result = decode_with_ffmpeg(filename, ffmpeg_path)
+        if result.returncode != 0:
+            return None, None
+        return _read_mono(io.BytesIO(result.stdout))
 
     def _read_audio_with_librosa(self, filename: str):
         try:
@@ -1396,34 +1954,39 @@ class MainWindow(QMainWindow):
             return None, None
 
     def _compute_recommendations(self, audio: np.ndarray, sr: int) -> dict:
-        if audio.ndim > 1:
-            samples = audio.mean(axis=0)
-        else:
-            samples = audio
+        import numpy as np
+        from audio_slicer.utils.slicer2 import downmix, get_rms
+
+        samples = downmix(audio)
         duration_sec = len(samples) / max(sr, 1)
         hop_ms = 20 if duration_sec > 1200 else 10
         hop_length = max(1, int(sr * hop_ms / 1000))
         win_length = max(hop_length, min(int(sr * 0.03), 4 * hop_length))
-        rms_list = get_rms(y=samples, frame_length=win_length, hop_length=hop_length).squeeze(0)
-        rms_db = 20 * np.log10(np.clip(rms_list, a_min=1e-12, a_max=None))
-        noise_floor = float(np.percentile(rms_db, 20))
+        # get_rms returns a fresh array, so convert it to dB in place
+        rms_db = get_rms(y=samples, frame_length=win_length, hop_length=hop_length).squeeze(0)
+        np.maximum(rms_db, 1e-12, out=rms_db)
+        np.log10(rms_db, out=rms_db)
+        rms_db *= 20
+        noise_floor = _percentiles(rms_db, (20,))[0]
         threshold_db = float(np.clip(noise_floor + 6.0, -80.0, -10.0))
 
-        silent = rms_db < threshold_db
-        silent_lengths = self._collect_run_lengths(silent)
-        voice_lengths = self._collect_run_lengths(~silent)
-        sil_ms = [int(length * hop_ms) for length in silent_lengths] if silent_lengths else []
-        voice_ms = [int(length * hop_ms) for length in voice_lengths] if voice_lengths else []
+        lengths, silent = _run_lengths(rms_db < threshold_db)
+        sil_ms = lengths[silent] * hop_ms
+        voice_ms = lengths[~silent] * hop_ms
 
-        min_interval = int(np.clip(np.percentile(sil_ms, 50), 200, 1200)) if sil_ms else 300
-        max_silence = int(np.clip(np.percentile(sil_ms, 90), 500, 5000)) if sil_ms else 1000
-        min_length = int(np.clip(np.percentile(voice_ms, 20), 500, 8000)) if voice_ms else 5000
+        if sil_ms.size:
+            sil_p50, sil_p90 = _percentiles(sil_ms, (50, 90))
+            min_interval = int(np.clip(sil_p50, 200, 1200))
+            max_silence = int(np.clip(sil_p90, 500, 5000))
+        else:
+            min_interval = 300
+            max_silence = 1000
+        min_length = int(np.clip(_percentiles(voice_ms, (20,))[0], 500, 8000)) if voice_ms.size else 5000
         min_interval = max(min_interval, hop_ms)
         max_silence = max(max_silence, hop_ms)
         min_length = max(min_length, min_interval)
 
-        parallel_mode = "thread" if self.ui.lwTaskList.count() > 1 else "single"
-        parallel_jobs = min(4, max(1, (os.cpu_count() or 1)))
+        parallel_jobs = _PARALLEL_JOBS_DEFAULTS["process"]
 
         return {
             "threshold_db": round(threshold_db, 1),
@@ -1436,43 +1999,19 @@ class MainWindow(QMainWindow):
             "vad_enabled": True,
             "vad_sensitivity_db": 6.0,
             "vad_hangover_ms": 120,
-            "parallel_mode": parallel_mode,
             "parallel_jobs": parallel_jobs,
             "fallback_mode": "ffmpeg_then_librosa",
         }
 
-    def _collect_run_lengths(self, mask: np.ndarray) -> list[int]:
-        lengths = []
-        count = 0
-        for value in mask:
-            if value:
-                count += 1
-            elif count:
-                lengths.append(count)
-                count = 0
-        if count:
-            lengths.append(count)
-        return lengths
-
     def _format_recommend_message(self, rec: dict) -> str:
         lang = self.current_language
-        enabled = i18n.text("recommend_enabled", lang)
-        disabled = i18n.text("recommend_disabled", lang)
+        enabled = _t("recommend_enabled", lang)
+        disabled = _t("recommend_disabled", lang)
         dyn_text = enabled if rec["dynamic_enabled"] else disabled
         vad_text = enabled if rec["vad_enabled"] else disabled
-        parallel_text = {
-            "single": i18n.text("parallel_mode_single", lang),
-            "thread": i18n.text("parallel_mode_thread", lang),
-            "process": i18n.text("parallel_mode_process", lang),
-        }.get(rec["parallel_mode"], rec["parallel_mode"])
-        fallback_text = {
-            "ask": i18n.text("fallback_mode_ask", lang),
-            "ffmpeg_then_librosa": i18n.text("fallback_mode_ffmpeg_then_librosa", lang),
-            "ffmpeg": i18n.text("fallback_mode_ffmpeg", lang),
-            "librosa": i18n.text("fallback_mode_librosa", lang),
-            "skip": i18n.text("fallback_mode_skip", lang),
-        }.get(rec["fallback_mode"], rec["fallback_mode"])
-        return i18n.text("recommend_message", lang).format(
+        parallel_text = _item_text(_PARALLEL_MODE_KEYS, rec["parallel_mode"], lang)
+        fallback_text = _item_text(_FALLBACK_MODE_KEYS, rec["fallback_mode"], lang)
+        return _t("recommend_message", lang).format(
             threshold=rec["threshold_db"],
             min_length=rec["min_length"],
             min_interval=rec["min_interval"],
@@ -1507,27 +2046,36 @@ class MainWindow(QMainWindow):
         if idx >= 0:
             self.ui.cbFallbackMode.setCurrentIndex(idx)
 
-    def _set_preview_image(self, image_path: str):
+    def _set_preview_image(self, pixmap: QPixmap):
         if self._preview_embed:
-            self._preview_pixmap_path = image_path
+            self._preview_source_pixmap = pixmap
             self._update_preview_pixmap()
             return
-        self._show_preview_window(image_path)
+        self._show_preview_window(pixmap)
 
     def _update_preview_pixmap(self):
-        if not self._preview_pixmap_path or not self._preview_embed:
+        if not self._preview_embed:
             return
-        pixmap = QPixmap(self._preview_pixmap_path)
-        if pixmap.isNull():
+        pixmap = self._preview_source_pixmap
+        if pixmap is None or pixmap.isNull():
             return
         target_size = self.labelPreview.size()
-        scaled = pixmap.scaled(target_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        self.labelPreview.setPixmap(scaled)
+        scaled_key = (pixmap.cacheKey(), target_size.width(), target_size.height())
+        if scaled_key == self._preview_last_scaled:
+            return
+        self._preview_last_scaled = scaled_key
+        self.labelPreview.setPixmap(_scaled_pixmap(pixmap, target_size))
         self.labelPreview.setText("")
 
+    def changeEvent(self, event):
+        if event.type() == QEvent.PaletteChange:
+            self._theme = None
+        super().changeEvent(event)
+
     def resizeEvent(self, event):
         super().resizeEvent(event)
-        self._update_preview_pixmap()
+        if self._preview_embed:
+            self._preview_resize_timer.start()
 
     def eventFilter(self, obj, event):
         if obj is self._preview_scroll_viewport and event.type() == QEvent.Wheel:
@@ -1541,20 +2089,17 @@ class MainWindow(QMainWindow):
                 return True
         return super().eventFilter(obj, event)
 
-    def _show_preview_window(self, image_path: str):
-        pixmap = QPixmap(image_path)
+    def _show_preview_window(self, pixmap: QPixmap):
         if pixmap.isNull():
             return
         if self._preview_window is None:
             self._preview_window = QDialog(self)
-            if self._style_sheet:
-                self._preview_window.setStyleSheet(self._style_sheet)
-            self._preview_window.setWindowTitle(i18n.text("preview", self.current_language))
+            self._preview_window.setWindowTitle(_t("preview", self.current_language))
             self._preview_window.setModal(False)
             layout = QVBoxLayout(self._preview_window)
             layout.setContentsMargins(10, 10, 10, 10)
             zoom_row = QHBoxLayout()
-            self._preview_zoom_label = QLabel(i18n.text("preview_zoom", self.current_language), self._preview_window)
+            self._preview_zoom_label = QLabel(_t("preview_zoom", self.current_language), self._preview_window)
             self._preview_zoom_slider = QSlider(Qt.Horizontal, self._preview_window)
             self._preview_zoom_slider.setRange(25, 400)
             self._preview_zoom_slider.setValue(100)
@@ -1575,10 +2120,11 @@ class MainWindow(QMainWindow):
             if self._preview_scroll_viewport:
                 self._preview_scroll_viewport.installEventFilter(self)
         else:
-            self._preview_window.setWindowTitle(i18n.text("preview", self.current_language))
+            self._preview_window.setWindowTitle(_t("preview", self.current_language))
         self._preview_original_pixmap = pixmap
         if self._preview_zoom_slider:
             self._preview_zoom_slider.setValue(100)
+        self._preview_zoom_timer.stop()
         self._update_preview_zoom()
         target_width = min(1400, pixmap.width() + 40)
         target_height = min(900, pixmap.height() + 60)
@@ -1590,15 +2136,14 @@ class MainWindow(QMainWindow):
     def _on_preview_zoom_changed(self, value: int):
         if self._preview_zoom_value:
             self._preview_zoom_value.setText(f"{value}%")
-        self._update_preview_zoom()
+        self._preview_zoom_timer.start()
 
     def _update_preview_zoom(self):
         if not self._preview_label or not self._preview_original_pixmap or not self._preview_zoom_slider:
             return
         scale = self._preview_zoom_slider.value() / 100.0
         target_size = self._preview_original_pixmap.size() * scale
-        scaled = self._preview_original_pixmap.scaled(target_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        self._preview_label.setPixmap(scaled)
+        self._preview_label.setPixmap(_scaled_pixmap(self._preview_original_pixmap, target_size))
 
     def _on_preview_selection(self):
         if self.processing:
@@ -1609,30 +2154,50 @@ class MainWindow(QMainWindow):
             QMessageBox.information(
                 self,
                 QApplication.applicationName(),
-                i18n.text("preview_no_selection", self.current_language),
+                _t("preview_no_selection", self.current_language),
             )
             return
         filename = item.data(Qt.ItemDataRole.UserRole + 1)
-        if not filename:
+        if not filename or not self._check_numeric_values():
             return
         try:
             self._preview_with_file(filename)
         except Exception as exc:
             self._on_preview_error(filename, str(exc))
 
+    def _read_mono_shared(self, filename: str) -> tuple[np.ndarray, int]:
+        # Preview and recommend usually decode the same file back to back, so
+        # the last decode is kept. Only the GUI thread stores it; the recommend
+        # thread hands its decode back through _on_recommended.
+        decode = _read_mono_cached(filename, self._last_decode)
+        self._keep_decode(decode)
+        return decode[1], decode[2]
+
+    def _keep_decode(self, decode: tuple[tuple, np.ndarray, int]):
+        self._last_decode = decode if decode[1].nbytes <= _SHARED_DECODE_MAX_BYTES else None
+
     def _preview_with_file(self, filename: str):
-        audio, sr = soundfile.read(filename, dtype=np.float32)
+        audio, sr = self._read_mono_shared(filename)
+        self._run_slice_and_preview(filename, audio, sr)
+
+    def _run_slice_and_preview(self, filename: str, audio: np.ndarray, sr: int):
+        from audio_slicer.utils.slicer2 import Slicer, downmix
+        from audio_slicer.utils.preview import SlicingPreview
+
         if len(audio.shape) > 1:
-            audio = audio.T
+            # Channel-first input: mix once so RMS and tagging do not each redo it
+            audio = downmix(audio)
         slicer = Slicer(
             sr=sr,
-            threshold=float(self.ui.leThreshold.text()),
-            min_length=int(self.ui.leMinLen.text()),
-            min_interval=int(self.ui.leMinInterval.text()),
-            hop_size=int(self.ui.leHopSize.text()),
-            max_sil_kept=int(self.ui.leMaxSilence.text()),
+            threshold=self._numeric_values["threshold_db"],
+            min_length=self._numeric_values["min_length"],
+            min_interval=self._numeric_values["min_interval"],
+            hop_size=self._numeric_values["hop_size"],
+            max_sil_kept=self._numeric_values["max_silence"],
+        )
+        rms_list, dynamic_threshold_db, vad_mask = self._build_slice_analysis(
+            slicer, audio, self._collect_analysis_options()
         )
-        rms_list, dynamic_threshold_db, vad_mask = self._build_slice_analysis(slicer, audio)
         sil_tags, total_frames, waveform_shape = slicer.get_slice_tags(
             audio,
             dynamic_threshold_db=dynamic_threshold_db,
@@ -1642,15 +2207,20 @@ class MainWindow(QMainWindow):
         preview = SlicingPreview(
             filename=filename,
             sil_tags=sil_tags,
-            hop_size=int(self.ui.leHopSize.text()),
+            hop_size=self._numeric_values["hop_size"],
             total_frames=total_frames,
             waveform_shape=waveform_shape,
             theme=self._get_theme(),
             language=self.current_language,
+            audio=audio,
+            sr=sr,
         )
-        preview_path = os.path.join(tempfile.gettempdir(), "audio_slicer_preview.png")
-        preview.save_plot(preview_path)
-        self._set_preview_image(preview_path)
+        data, width, height = preview.render_rgba()
+        if len(data) != width * height * 4:
+            raise ValueError("Preview image size does not match its pixel buffer.")
+        # fromImage copies the pixels, so the borrowed buffer may go after this
+        image = QImage(data, width, height, width * 4, QImage.Format_RGBA8888)
+        self._set_preview_image(QPixmap.fromImage(image))
 
     def _on_preview_error(self, filename: str, error: str):
         choice = self._show_fallback_dialog("preview_read_failed", filename, error)
@@ -1659,22 +2229,23 @@ class MainWindow(QMainWindow):
         elif choice == "librosa":
             self._preview_with_librosa(filename)
 
+    @Slot(str, str, str, result=str)
     def _show_fallback_dialog(self, prompt_key: str, filename: str, error: str) -> str:
         msg = QMessageBox(self)
         msg.setIcon(QMessageBox.Warning)
-        msg.setWindowTitle(i18n.text("warning_title", self.current_language))
+        msg.setWindowTitle(_t("warning_title", self.current_language))
         msg.setText(
-            i18n.text(prompt_key, self.current_language).format(
+            _t(prompt_key, self.current_language).format(
                 file=filename,
                 error=error,
             )
         )
         btn_ffmpeg = msg.addButton(
-            i18n.text("preview_use_ffmpeg", self.current_language),
+            _t("preview_use_ffmpeg", self.current_language),
             QMessageBox.ActionRole,
         )
         btn_librosa = msg.addButton(
-            i18n.text("preview_use_librosa", self.current_language),
+            _t("preview_use_librosa", self.current_language),
             QMessageBox.ActionRole,
         )
         msg.addButton(QMessageBox.Cancel)
@@ -1687,60 +2258,61 @@ class MainWindow(QMainWindow):
         return "cancel"
 
     def _preview_with_ffmpeg(self, filename: str):
-        ffmpeg_path = resolve_ffmpeg_path()
+        import numpy as np
+        from audio_slicer.utils.processing import ffmpeg_error_text
+
+        ffmpeg_path = _ffmpeg_path()
         if not ffmpeg_path:
             QMessageBox.warning(
                 self,
-                i18n.text("warning_title", self.current_language),
-                i18n.text("ffmpeg_not_found", self.current_language),
+                _t("warning_title", self.current_language),
+                _t("ffmpeg_not_found", self.current_language),
+            )
+            return
+        # Decode straight to raw float samples on stdout instead of a temp wav.
+        # Raw PCM carries no header, so the rate and channel count are fixed.
+        result = subprocess.run(
+            [
+                ffmpeg_path,
+                "-hide_banner",
+                "-loglevel",
+                "error",
+                "-i",
+                filename,
+                "-vn",
+                "-f",
+                "f32le",
+                "-acodec",
+                "pcm_f32le",
+                "-ac",
+                "1",
+                "-ar",
+                str(_PREVIEW_DECODE_SR),
+                "-",
+            ],
+            capture_output=True,
+        )
+        if result.returncode != 0:
+            QMessageBox.warning(
+                self,
+                _t("warning_title", self.current_language),
+                _t("ffmpeg_failed", self.current_language).format(
+                    error=ffmpeg_error_text(result),
+                ),
             )
             return
-        with tempfile.NamedTemporaryFile(
-            prefix="audio_slicer_preview_",
-            suffix=".wav",
-            delete=False,
-        ) as tmp:
-            temp_path = tmp.name
         try:
-            result = subprocess.run(
-                [
-                    ffmpeg_path,
-                    "-y",
-                    "-i",
-                    filename,
-                    "-vn",
-                    "-acodec",
-                    "pcm_s16le",
-                    temp_path,
-                ],
-                capture_output=True,
-                text=True,
+            audio = np.frombuffer(result.stdout, dtype=np.float32)
+            self._run_slice_and_preview(filename, audio, _PREVIEW_DECODE_SR)
+        except Exception as exc:
+            QMessageBox.warning(
+                self,
+                _t("warning_title", self.current_language),
+                _t("read_failed", self.current_language).format(
+                    file=filename,
+                    error=str(exc),
+                ),
             )
-            if result.returncode != 0:
-                QMessageBox.warning(
-                    self,
-                    i18n.text("warning_title", self.current_language),
-                    i18n.text("ffmpeg_failed", self.current_language).format(
-                        error=result.stderr.strip() or result.stdout.strip(),
-                    ),
-                )
-                return
-            try:
-                self._preview_with_file(temp_path)
-            except Exception as exc:
-                QMessageBox.warning(
-                    self,
-                    i18n.text("warning_title", self.current_language),
-                    i18n.text("read_failed", self.current_language).format(
-                        file=filename,
-                        error=str(exc),
-                    ),
-                )
-        finally:
-            try:
-                os.remove(temp_path)
-            except OSError:
-                pass
 
     def _preview_with_librosa(self, filename: str):
         try:
@@ -1748,38 +2320,22 @@ class MainWindow(QMainWindow):
         except Exception as exc:
             QMessageBox.warning(
                 self,
-                i18n.text("warning_title", self.current_language),
-                i18n.text("read_failed", self.current_language).format(
+                _t("warning_title", self.current_language),
+                _t("read_failed", self.current_language).format(
                     file=filename,
                     error=str(exc),
                 ),
             )
             return
         try:
+            # librosa already returns channel-first float32 audio
             audio, sr = librosa.load(filename, sr=None, mono=False)
-            if audio.ndim > 1:
-                audio_to_write = audio.T
-            else:
-                audio_to_write = audio
-            with tempfile.NamedTemporaryFile(
-                prefix="audio_slicer_preview_",
-                suffix=".wav",
-                delete=False,
-            ) as tmp:
-                temp_path = tmp.name
-            soundfile.write(temp_path, audio_to_write, sr)
-            try:
-                self._preview_with_file(temp_path)
-            finally:
-                try:
-                    os.remove(temp_path)
-                except OSError:
-                    pass
+            self._run_slice_and_preview(filename, audio, sr)
         except Exception as exc:
             QMessageBox.warning(
                 self,
-                i18n.text("warning_title", self.current_language),
-                i18n.text("read_failed", self.current_language).format(
+                _t("warning_title", self.current_language),
+                _t("read_failed", self.current_language).format(
                     file=filename,
                     error=str(exc),
                 ),
@@ -1790,33 +2346,30 @@ class MainWindow(QMainWindow):
         if self.processing:
             self._warningProcessNotFinished()
             event.ignore()
+            return
+        self._flush_presets()
+        self._shutdown_process_pool()
+        if self._recommend_thread is not None:
+            self._recommend_thread.wait()
 
     def dragEnterEvent(self, event):
-        urls = event.mimeData().urls()
-        has_wav = False
-        for url in urls:
-            if not url.isLocalFile():
-                continue
-            path = url.toLocalFile()
-            ext = os.path.splitext(path)[1]
-            if ext[1:].lower() in self.availableFormats:
-                has_wav = True
-                break
+        extensions = _audio_extensions()
+        has_wav = any(
+            url.isLocalFile() and url.toLocalFile().rpartition(".")[2].lower() in extensions
+            for url in event.mimeData().urls()
+        )
         if has_wav:
             event.accept()
 
     def dropEvent(self, event):
         urls = event.mimeData().urls()
+        extensions = _audio_extensions()
+        paths = []
         for url in urls:
             if not url.isLocalFile():
                 continue
             path = url.toLocalFile()
-            ext = os.path.splitext(path)[1]
-            if ext[1:].lower() not in self.availableFormats:
+            if path.rpartition(".")[2].lower() not in extensions:
                 continue
-            item = QListWidgetItem()
-            item.setSizeHint(QSize(200, 24))
-            item.setText(QFileInfo(path).fileName())
-            item.setData(Qt.ItemDataRole.UserRole + 1,
-                         path)
-            self.ui.lwTaskList.addItem(item)
+            paths.append(path)
+        self._append_task_items(paths)
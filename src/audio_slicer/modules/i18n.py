@@ -1109,6 +1109,19 @@ STRINGS: dict[str, dict[str, str]] = {
         "pt-BR": "Failed to process file:\n{file}\n\n{error}",
         "it": "Failed to process file:\n{file}\n\n{error}",
     },
+    "invalid_value": {
+        "en": "Invalid value for {field}.",
+        "zh-CN": "{field} 的值无效。",
+        "zh-TW": "{field} 的值無效。",
+        "ja": "{field} の値が無効です。",
+        "ko": "{field} 값이 올바르지 않습니다.",
+        "fr": "Valeur invalide pour {field}.",
+        "de": "Ungültiger Wert für {field}.",
+        "es": "Valor no válido para {field}.",
+        "ru": "Недопустимое значение для {field}.",
+        "pt-BR": "Valor inválido para {field}.",
+        "it": "Valore non valido per {field}.",
+    },
     "preview_read_failed": {
         "en": "Preview failed to read file:\n{file}\n\n{error}\n\nChoose a fallback method:",
         "zh-CN": "预览读取失败：\n{file}\n\n{error}\n\n请选择一种替代方式：",
@@ -1136,39 +1149,30 @@ STRINGS: dict[str, dict[str, str]] = {
         "it": "Failed to process file:\n{file}\n\n{error}\n\nChoose a fallback method:",
     },
     "parallel_process_fallback_hint": {
-        "en": "Multi-process mode does not support interactive fallback prompts.\n"
-              "It will switch to \"FFmpeg → Librosa\" automatically.\n"
-              "Continue?",
-        "zh-CN": "多进程模式无法逐个弹窗选择回退方式。\n"
-                 "将自动切换为“FFmpeg → Librosa”。\n"
-                 "是否继续？",
-        "zh-TW": "多行程模式無法逐個彈窗選擇回退方式。\n"
-                 "將自動切換為「FFmpeg → Librosa」。\n"
-                 "是否繼續？",
-        "ja": "マルチプロセスでは個別のフォールバック確認はできません。\n"
-              "自動的に「FFmpeg → Librosa」に切り替えます。\n"
-              "続行しますか？",
-        "ko": "멀티 프로세스에서는 개별 폴백 선택을 지원하지 않습니다.\n"
-              "자동으로 \"FFmpeg → Librosa\"로 전환합니다.\n"
-              "계속하시겠습니까?",
-        "fr": "Le mode multiprocessus ne prend pas en charge les demandes interactives.\n"
-              "Il basculera automatiquement sur « FFmpeg → Librosa ».\n"
-              "Continuer ?",
-        "de": "Im Multi-Process-Modus sind interaktive Rückfragen nicht verfügbar.\n"
-              "Es wird automatisch auf „FFmpeg → Librosa“ umgestellt.\n"
-              "Fortfahren?",
-        "es": "El modo multiproceso no admite confirmaciones interactivas.\n"
-              "Se cambiará automáticamente a \"FFmpeg → Librosa\".\n"
-              "¿Continuar?",
-        "ru": "Многопроцессный режим не поддерживает интерактивные запросы.\n"
-              "Будет автоматически переключено на «FFmpeg → Librosa».\n"
-              "Продолжить?",
-        "pt-BR": "O modo multiprocesso não suporta perguntas interativas.\n"
-                 "Ele alternará automaticamente para \"FFmpeg → Librosa\".\n"
-                 "Continuar?",
-        "it": "La modalità multiprocesso non supporta richieste interattive.\n"
-              "Passerà automaticamente a \"FFmpeg → Librosa\".\n"
-              "Continuare?",
+        "en": "Multi-process mode does not support interactive fallback prompts. It will switch to \"FFmpeg → Librosa\" automatically.",
+        "zh-CN": "多进程模式无法逐个弹窗选择回退方式。将自动切换为“FFmpeg → Librosa”。",
+        "zh-TW": "多行程模式無法逐個彈窗選擇回退方式。將自動切換為「FFmpeg → Librosa」。",
+        "ja": "マルチプロセスでは個別のフォールバック確認はできません。自動的に「FFmpeg → Librosa」に切り替えます。",
+        "ko": "멀티 프로세스에서는 개별 폴백 선택을 지원하지 않습니다. 자동으로 \"FFmpeg → Librosa\"로 전환합니다.",
+        "fr": "Le mode multiprocessus ne prend pas en charge les demandes interactives. Il basculera automatiquement sur « FFmpeg → Librosa ».",
+        "de": "Im Multi-Process-Modus sind interaktive Rückfragen nicht verfügbar. Es wird automatisch auf „FFmpeg → Librosa“ umgestellt.",
+        "es": "El modo multiproceso no admite confirmaciones interactivas. Se cambiará automáticamente a \"FFmpeg → Librosa\".",
+        "ru": "Многопроцессный режим не поддерживает интерактивные запросы. Будет автоматически переключено на «FFmpeg → Librosa».",
+        "pt-BR": "O modo multiprocesso não suporta perguntas interativas. Ele alternará automaticamente para \"FFmpeg → Librosa\".",
+        "it": "La modalità multiprocesso non supporta richieste interattive. Passerà automaticamente a \"FFmpeg → Librosa\".",
+    },
+    "thread_librosa_fallback_hint": {
+        "en": "Multi-thread mode keeps Librosa as the last resort. It will switch to \"FFmpeg → Librosa\" automatically.",
+        "zh-CN": "多线程模式仅将 Librosa 作为最后的回退方式。将自动切换为“FFmpeg → Librosa”。",
+        "zh-TW": "多執行緒模式僅將 Librosa 作為最後的回退方式。將自動切換為「FFmpeg → Librosa」。",
+        "ja": "マルチスレッドでは Librosa は最後の手段としてのみ使用します。自動的に「FFmpeg → Librosa」に切り替えます。",
+        "ko": "멀티 스레드에서는 Librosa를 마지막 수단으로만 사용합니다. 자동으로 \"FFmpeg → Librosa\"로 전환합니다.",
+        "fr": "Le mode multi-thread garde Librosa en dernier recours. Il basculera automatiquement sur « FFmpeg → Librosa ».",
+        "de": "Im Multi-Thread-Modus wird Librosa nur als letzte Möglichkeit genutzt. Es wird automatisch auf „FFmpeg → Librosa“ umgestellt.",
+        "es": "El modo multi-hilo deja Librosa como último recurso. Se cambiará automáticamente a \"FFmpeg → Librosa\".",
+        "ru": "Многопоточный режим использует Librosa только в крайнем случае. Будет автоматически переключено на «FFmpeg → Librosa».",
+        "pt-BR": "O modo multi-thread mantém o Librosa como último recurso. Ele alternará automaticamente para \"FFmpeg → Librosa\".",
+        "it": "La modalità multi-thread usa Librosa solo come ultima risorsa. Passerà automaticamente a \"FFmpeg → Librosa\".",
     },
     "skipped_by_user": {
         "en": "Skipped by user.",
@@ -1296,6 +1300,19 @@ STRINGS: dict[str, dict[str, str]] = {
         "pt-BR": "Corte concluído!",
         "it": "Taglio completato!",
     },
+    "slicing_errors": {
+        "en": "{count} file(s) failed to process. See the details for each error.",
+        "zh-CN": "{count} 个文件处理失败，请查看详细信息。",
+        "zh-TW": "{count} 個檔案處理失敗，請查看詳細資訊。",
+        "ja": "{count} 件のファイルの処理に失敗しました。詳細を確認してください。",
+        "ko": "{count}개 파일 처리에 실패했습니다. 자세한 내용을 확인하세요.",
+        "fr": "Échec du traitement de {count} fichier(s). Voir les détails.",
+        "de": "{count} Datei(en) konnten nicht verarbeitet werden. Siehe Details.",
+        "es": "No se pudieron procesar {count} archivo(s). Consulte los detalles.",
+        "ru": "Не удалось обработать файлов: {count}. См. подробности.",
+        "pt-BR": "Falha ao processar {count} arquivo(s). Veja os detalhes.",
+        "it": "Impossibile elaborare {count} file. Vedi i dettagli.",
+    },
     "select_audio_files": {
         "en": "Select Audio Files",
         "zh-CN": "选择音频文件",
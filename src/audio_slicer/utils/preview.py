@@ -1,6 +1,7 @@
 import soundfile
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 
 plt.rcParams["font.sans-serif"] = ["Microsoft YaHei", "SimHei", "Arial Unicode MS", "DejaVu Sans"]
 plt.rcParams["font.family"] = "sans-serif"
@@ -109,7 +110,9 @@ class SlicingPreview:
                  total_frames: int,
                  waveform_shape: int,
                  theme: str,
-                 language: str = "en"):
+                 language: str = "en",
+                 audio: np.ndarray | None = None,
+                 sr: int | None = None):
         self.filename = filename
         self.sil_tags = sil_tags
         self.hop_size = hop_size
@@ -117,11 +120,17 @@ class SlicingPreview:
         self.waveform_shape = waveform_shape
         self.theme = theme
         self.language = language
-        ori_audio, ori_sr = soundfile.read(filename, dtype=np.float32)
+        if audio is None or sr is None:
+            # Channel-last as read from disk; transpose to match decoded input
+            ori_audio, ori_sr = soundfile.read(filename, dtype=np.float32)
+            if len(ori_audio.shape) > 1:
+                ori_audio = ori_audio.T
+        else:
+            # Already decoded, channel-first like the slicer input
+            ori_audio, ori_sr = audio, sr
 
         # Convert to mono if not
         if len(ori_audio.shape) > 1:
-            ori_audio = ori_audio.T
             ori_audio = AudioUtil.to_mono(ori_audio)
 
         self.duration_ms = (ori_audio.shape[-1] / ori_sr) * 1000.0
@@ -180,7 +189,7 @@ class SlicingPreview:
             values.append(round(list_item[1], 3))
         return items, values
 
-    def _plot_preview(self, preview_filename: str):
+    def _plot_preview(self):
         time = np.arange(0, len(self.audio_samples)) * (1.0 / self.target_sr)
 
         palette = dark_theme_palette if self.theme == 'dark' else light_theme_palette
@@ -319,11 +328,30 @@ class SlicingPreview:
                 "color": palette['title']
             }
         )
-        plt.savefig(preview_filename, dpi=150)
         # plt.show()
+        return fig
 
     def save_plot(self, filename: str):
-        self._plot_preview(filename)
+        fig = self._plot_preview()
+        try:
+            fig.savefig(filename, dpi=150)
+        finally:
+            plt.close(fig)
+
+    def render_rgba(self, dpi: int = 150) -> tuple[bytes, int, int]:
+        # Raw RGBA pixels straight from Agg, so the GUI can show the preview
+        # without a PNG encode, a temp file and a decode on every click
+        fig = self._plot_preview()
+        try:
+            # Draw on a plain Agg canvas so the size comes from the renderer
+            # that filled the buffer, whatever the pyplot backend is
+            canvas = FigureCanvasAgg(fig)
+            fig.set_dpi(dpi)
+            canvas.draw()
+            data, (width, height) = canvas.print_to_buffer()
+        finally:
+            plt.close(fig)
+        return data, width, height
 
 
 if __name__ == "__main__":
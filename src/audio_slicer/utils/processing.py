@@ -1,21 +1,41 @@
 import csv
 import datetime
+import functools
+import io
 import json
 import os
 import shutil
 import subprocess
 import sys
-import tempfile
 from pathlib import Path
 
 import numpy as np
 import soundfile
 
 from audio_slicer.modules import i18n
-from audio_slicer.utils.slicer2 import Slicer, estimate_dynamic_threshold_db, build_vad_mask
+from audio_slicer.utils.slicer2 import Slicer, estimate_dynamic_threshold_db, build_vad_mask, vad_hangover_frames
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_SLICE_FIELDS = ("index", "start_ms", "end_ms", "length_ms", "output_path", "source_file")
+
+
+_ffmpeg_path_found: str | None = None
 
 
 def resolve_ffmpeg_path() -> str | None:
+    # Probed once per process; only a successful lookup is kept, so
+    # installing ffmpeg later still works
+    global _ffmpeg_path_found
+    if _ffmpeg_path_found is None:
+        _ffmpeg_path_found = _find_ffmpeg()
+    return _ffmpeg_path_found
+
+
+def _find_ffmpeg() -> str | None:
     env_path = os.environ.get("AUDIO_SLICER_FFMPEG")
     if env_path and os.path.isfile(env_path):
         return env_path
@@ -36,37 +56,81 @@ def resolve_ffmpeg_path() -> str | None:
     return shutil.which("ffmpeg")
 
 
+def ffmpeg_error_text(result: subprocess.CompletedProcess) -> str:
+    # Only the tail is worth showing; decode it rather than the whole log.
+    # stdout may hold raw samples, so it is never used as the message.
+    return (result.stderr or b"")[-2048:].decode("utf-8", "replace").strip()
+
+
+def decode_with_ffmpeg(filename: str, ffmpeg_path: str) -> subprocess.CompletedProcess:
+    # Stream a 16-bit WAV over stdout so the decoded PCM never goes through a
+    # temp file; the header keeps the source rate and channel count.
+    return subprocess.run(
+        [
+            ffmpeg_path,
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            "-i",
+            filename,
+            "-vn",
+            "-f",
+            "wav",
+            "-acodec",
+            "pcm_s16le",
+            "-",
+        ],
+        capture_output=True,
+    )
+
+
 def _read_with_ffmpeg(filename: str, ffmpeg_path: str) -> tuple[np.ndarray | None, int | None, str | None]:
-    with tempfile.NamedTemporaryFile(
-        prefix="audio_slicer_decode_",
-        suffix=".wav",
-        delete=False,
-    ) as tmp:
-        temp_path = tmp.name
+    result = decode_with_ffmpeg(filename, ffmpeg_path)
+    if result.returncode != 0:
+        return None, None, ffmpeg_error_text(result)
+    audio, sr = soundfile.read(io.BytesIO(result.stdout), dtype=np.float32)
+    return audio, sr, None
+
+
+@functools.cache
+def _av_module():
+    # PyAV is optional. A failed import is not cached by Python, so probe once
+    # per process rather than searching sys.path again for every file.
     try:
-        result = subprocess.run(
-            [
-                ffmpeg_path,
-                "-y",
-                "-i",
-                filename,
-                "-vn",
-                "-acodec",
-                "pcm_s16le",
-                temp_path,
-            ],
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode != 0:
-            return None, None, result.stderr.strip() or result.stdout.strip()
-        audio, sr = soundfile.read(temp_path, dtype=np.float32)
-        return audio, sr, None
-    finally:
-        try:
-            os.remove(temp_path)
-        except OSError:
-            pass
+        import av
+    except Exception:
+        return None
+    return av
+
+
+def _read_with_av(filename: str) -> tuple[np.ndarray | None, int | None, str | None]:
+    # PyAV runs the FFmpeg decoders in-process, so a batch of fallbacks does
+    # not pay an ffmpeg launch per file. Without it there is no error to
+    # report; the subprocess path is simply used.
+    av = _av_module()
+    if av is None:
+        return None, None, None
+    try:
+        with av.open(filename) as container:
+            stream = container.streams.audio[0]
+            channels = len(stream.layout.channels)
+            # Packed float32 comes out interleaved, the layout soundfile returns
+            resampler = av.AudioResampler(format="flt", layout=stream.layout, rate=stream.rate)
+            parts = []
+            for frame in container.decode(stream):
+                parts.extend(out.to_ndarray() for out in resampler.resample(frame))
+            parts.extend(out.to_ndarray() for out in resampler.resample(None))
+            sr = stream.rate
+        if not parts:
+            return None, None, "No audio decoded."
+        audio = np.concatenate(parts, axis=1).reshape(-1, channels)
+        return (audio[:, 0] if channels == 1 else audio), sr, None
+    except Exception as exc:
+        return None, None, str(exc)
+
+
+def _join_errors(*errors: str | None) -> str:
+    return "\n".join(error for error in errors if error)
 
 
 def _read_with_librosa(filename: str) -> tuple[np.ndarray | None, int | None, str | None]:
@@ -76,7 +140,9 @@ def _read_with_librosa(filename: str) -> tuple[np.ndarray | None, int | None, st
         return None, None, str(exc)
     try:
         audio, sr = librosa.load(filename, sr=None, mono=False)
-        return audio, sr, None
+        # librosa is channel-first; match soundfile's [N, ch] like the other
+        # readers. The view costs nothing and _prepare_audio flips it back.
+        return audio.T, sr, None
     except Exception as exc:
         return None, None, str(exc)
 
@@ -121,22 +187,34 @@ def process_audio_file(
             return False, error, None
         audio = None
         sr = None
+    av_error = None
+    ffmpeg_path = None
+    if audio is None and fallback_mode in {"ffmpeg", "ffmpeg_then_librosa"}:
+        # An explicit "ffmpeg" choice decodes with the configured binary and
+        # PyAV only stands in when there is none; the automatic chain tries
+        # PyAV first to skip an ffmpeg launch per file.
+        ffmpeg_path = resolve_ffmpeg_path()
+        if fallback_mode == "ffmpeg_then_librosa" or not ffmpeg_path:
+            audio, sr, av_error = _read_with_av(filename)
+            if av_error:
+                av_error = f"PyAV: {av_error}"
     if audio is None:
         if fallback_mode in {"ffmpeg", "ffmpeg_then_librosa"}:
-            ffmpeg_path = resolve_ffmpeg_path()
             if not ffmpeg_path:
                 if fallback_mode == "ffmpeg":
-                    return False, i18n.text("ffmpeg_not_found", language), None
+                    return False, _join_errors(i18n.text("ffmpeg_not_found", language), av_error), None
+                error = av_error or error
             else:
                 audio, sr, ffmpeg_error = _read_with_ffmpeg(filename, ffmpeg_path)
                 if audio is None and fallback_mode == "ffmpeg":
-                    return False, i18n.text("ffmpeg_failed", language).format(error=ffmpeg_error or ""), None
+                    message = i18n.text("ffmpeg_failed", language).format(error=_join_errors(ffmpeg_error, av_error))
+                    return False, message, None
                 if audio is None:
-                    error = ffmpeg_error
+                    error = _join_errors(ffmpeg_error, av_error)
         if audio is None and fallback_mode in {"librosa", "ffmpeg_then_librosa"}:
             audio, sr, librosa_error = _read_with_librosa(filename)
             if audio is None:
-                return False, librosa_error or error or "Decode failed.", None
+                return False, _join_errors(error, librosa_error) or "Decode failed.", None
     if audio is None or sr is None:
         return False, error or "Decode failed.", None
 
@@ -158,14 +236,11 @@ def process_audio_file(
         dynamic_threshold_db = estimate_dynamic_threshold_db(rms_list, offset_db=dynamic_offset_db)
     if vad_enabled and rms_list is not None:
         base_threshold = dynamic_threshold_db if dynamic_threshold_db is not None else slicer.threshold_db
-        hangover_frames = 0
-        if vad_hangover_ms > 0 and hop_size > 0:
-            hangover_frames = max(1, int(round(vad_hangover_ms / hop_size)))
         vad_mask = build_vad_mask(
             rms_list,
             threshold_db=base_threshold,
             sensitivity_db=vad_sensitivity_db,
-            hangover_frames=hangover_frames,
+            hangover_frames=vad_hangover_frames(vad_hangover_ms, hop_size),
         )
     sil_tags, total_frames, _ = slicer.get_slice_tags(
         audio,
@@ -191,6 +266,8 @@ def process_audio_file(
     for i, chunk in enumerate(chunks):
         path = os.path.join(out_dir, f"{file_core}_{i}.{output_ext}")
         if not is_mono:
+            # A slice of the transposed view flips back to contiguous rows of
+            # the decoded buffer, so soundfile writes it without a copy.
             chunk = chunk.T
         soundfile.write(path, chunk, sr)
         if i < len(ranges):
@@ -212,29 +289,58 @@ def process_audio_file(
     if export_csv:
         csv_path = os.path.join(out_dir, f"{file_core}_slices.csv")
         with open(csv_path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(
-                f,
-                fieldnames=["index", "start_ms", "end_ms", "length_ms", "output_path", "source_file"],
-            )
-            writer.writeheader()
-            for record in slice_records:
-                writer.writerow({key: "" if value is None else value for key, value in record.items()})
+            # csv writes None as an empty cell, so the rows go out in one call
+            writer = csv.writer(f)
+            writer.writerow(_SLICE_FIELDS)
+            writer.writerows(record.values() for record in slice_records)
     if export_json:
         json_path = os.path.join(out_dir, f"{file_core}_slices.json")
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(slice_records, f, ensure_ascii=False, indent=2)
+        if orjson is not None:
+            with open(json_path, "wb") as f:
+                f.write(orjson.dumps(slice_records, option=orjson.OPT_INDENT_2))
+        else:
+            with open(json_path, "w", encoding="utf-8") as f:
+                json.dump(slice_records, f, ensure_ascii=False, indent=2)
 
     return True, None, str(out_dir)
 
 
+def init_process_worker():
+    # Runs once per spawned worker: importing this module already pulled in
+    # numpy/soundfile/slicer2; also warm libsndfile's format table
+    soundfile.available_formats()
+
+
+def process_audio_file_in_worker(filename: str, kwargs: dict) -> tuple[bool, str | None, str | None]:
+    # Report failures as results so one bad file does not fail its whole chunk.
+    try:
+        return process_audio_file(filename, **kwargs)
+    except Exception as exc:
+        return False, str(exc), None
+
+
+def process_audio_files_in_worker(
+    filenames: tuple[str, ...],
+    kwargs: dict,
+) -> list[tuple[bool, str | None, str | None]]:
+    # The run settings travel with each chunk, so a long-lived pool serves
+    # any settings without being respawned
+    return [process_audio_file_in_worker(filename, kwargs) for filename in filenames]
+
+
 def _get_ranges(sil_tags, total_frames: int, hop_ms: int):
     if len(sil_tags) == 0:
         return [(0, total_frames * hop_ms)]
-    ranges = []
-    if sil_tags[0][0] > 0:
-        ranges.append((0, sil_tags[0][0] * hop_ms))
-    for i in range(len(sil_tags) - 1):
-        ranges.append((sil_tags[i][1] * hop_ms, sil_tags[i + 1][0] * hop_ms))
-    if sil_tags[-1][1] < total_frames:
-        ranges.append((sil_tags[-1][1] * hop_ms, total_frames * hop_ms))
-    return ranges
+    # Each slice runs from the end of one silence to the start of the next;
+    # the audio before the first and after the last is kept when non-empty
+    tags = np.asarray(sil_tags, dtype=np.int64)
+    starts = tags[:-1, 1]
+    ends = tags[1:, 0]
+    if tags[0, 0] > 0:
+        starts = np.concatenate(([0], starts))
+        ends = np.concatenate((tags[:1, 0], ends))
+    if tags[-1, 1] < total_frames:
+        starts = np.append(starts, tags[-1, 1])
+        ends = np.append(ends, total_frames)
+    # tolist() hands back Python ints, which the JSON export can serialize
+    return list(zip((starts * hop_ms).tolist(), (ends * hop_ms).tolist()))
@@ -5,7 +5,22 @@ import numpy as np
 import soundfile
 
 
-# This function is obtained from librosa.
+def downmix(waveform: np.ndarray) -> np.ndarray:
+    # Same values as waveform.mean(axis=0) for channel-first audio, but adds
+    # whole channel rows instead of reducing over the short channel axis,
+    # which is several times faster on a transposed interleaved buffer
+    if waveform.ndim == 1:
+        return waveform
+    if len(waveform) == 1:
+        return waveform[0].copy()
+    samples = waveform[0] + waveform[1]
+    for channel in waveform[2:]:
+        samples += channel
+    samples /= len(waveform)
+    return samples
+
+
+# This function is adapted from librosa.
 def get_rms(
     y,
     *,
@@ -13,37 +28,43 @@ def get_rms(
     hop_length=512,
     pad_mode="constant",
 ):
-    padding = (int(frame_length // 2), int(frame_length // 2))
-    y = np.pad(y, padding, mode=pad_mode)
-
-    axis = -1
-    # put our new within-frame axis at the end for now
-    out_strides = y.strides + tuple([y.strides[axis]])
-    # Reduce the shape on the framing axis
-    x_shape_trimmed = list(y.shape)
-    x_shape_trimmed[axis] -= frame_length - 1
-    out_shape = tuple(x_shape_trimmed) + tuple([frame_length])
-    xw = np.lib.stride_tricks.as_strided(
-        y, shape=out_shape, strides=out_strides
-    )
-    if axis < 0:
-        target_axis = axis - 1
+    pad = int(frame_length // 2)
+    n_frames = max(0, 1 + (y.shape[-1] + 2 * pad - frame_length) // hop_length)
+
+    # Frame t covers `full` whole hop-sized blocks starting at block t plus the
+    # first `rest` samples of the block after them. Summing squares per block
+    # once keeps the cost linear in the signal, not in signal * frame_length,
+    # and unlike a running cumsum it cannot turn digital silence into noise.
+    full, rest = divmod(frame_length, hop_length)
+    n_blocks = n_frames + full + 1
+    padded = np.zeros(y.shape[:-1] + (n_blocks * hop_length,), dtype=y.dtype)
+    if pad_mode == "constant":
+        padded[..., pad:pad + y.shape[-1]] = y
     else:
-        target_axis = axis + 1
-    xw = np.moveaxis(xw, -1, target_axis)
-    # Downsample along the target axis
-    slices = [slice(None)] * xw.ndim
-    slices[axis] = slice(0, None, hop_length)
-    x = xw[tuple(slices)]
+        padding = [(0, 0)] * (y.ndim - 1) + [(pad, pad)]
+        padded[..., :y.shape[-1] + 2 * pad] = np.pad(y, padding, mode=pad_mode)
+    blocks = padded.reshape(y.shape[:-1] + (n_blocks, hop_length))
+    total = np.zeros(y.shape[:-1] + (n_frames,), dtype=np.float64)
+    if full:
+        block_sums = np.einsum("...i,...i->...", blocks, blocks).astype(np.float64)
+        for j in range(full):
+            total += block_sums[..., j:j + n_frames]
+    if rest:
+        tail = blocks[..., full:full + n_frames, :rest]
+        total += np.einsum("...i,...i->...", tail, tail)
 
     # Calculate power
-    power = np.mean(np.abs(x) ** 2, axis=-2, keepdims=True)
+    power = (total / frame_length).astype(np.result_type(y.dtype, np.float32))
 
-    return np.sqrt(power)
+    return np.sqrt(power)[..., np.newaxis, :]
 
 
 def rms_to_db(rms: np.ndarray, eps: float = 1e-12) -> np.ndarray:
-    return 20 * np.log10(np.clip(rms, a_min=eps, a_max=None))
+    # One output buffer, reused for the log and the scaling
+    db = np.maximum(rms, eps)
+    np.log10(db, out=db)
+    db *= 20
+    return db
 
 
 def estimate_dynamic_threshold_db(
@@ -60,6 +81,12 @@ def estimate_dynamic_threshold_db(
     return float(np.clip(threshold_db, min_db, max_db))
 
 
+def vad_hangover_frames(hangover_ms: int, hop_ms: int) -> int:
+    if hangover_ms <= 0 or hop_ms <= 0:
+        return 0
+    return max(1, int(round(hangover_ms / hop_ms)))
+
+
 def build_vad_mask(
     rms_list: np.ndarray,
     *,
@@ -67,12 +94,23 @@ def build_vad_mask(
     sensitivity_db: float = 6.0,
     hangover_frames: int = 0,
 ) -> np.ndarray:
-    rms_db = rms_to_db(rms_list)
-    vad_threshold_db = threshold_db - sensitivity_db
-    mask = rms_db >= vad_threshold_db
-    if hangover_frames > 1:
-        kernel = np.ones(hangover_frames, dtype=np.int32)
-        mask = np.convolve(mask.astype(np.int32), kernel, mode="same") > 0
+    # Compare in the linear domain instead of taking log10 of every frame;
+    # rms_to_db floors at 1e-12, so a threshold at or below that passes all
+    vad_threshold = 10 ** ((threshold_db - sensitivity_db) / 20.)
+    if vad_threshold <= 1e-12:
+        vad_threshold = 0.
+    mask = rms_list >= vad_threshold
+    if hangover_frames > 1 and len(mask):
+        # Same window as np.convolve(mask, ones(k), mode="same") > 0, from
+        # running counts so the cost does not grow with the hangover length
+        k = hangover_frames
+        counts = np.cumsum(mask, dtype=np.int64)
+        counts = np.concatenate((
+            np.zeros(k // 2 + 1, dtype=np.int64),
+            counts,
+            np.full((k - 1) // 2, counts[-1], dtype=np.int64),
+        ))
+        mask = counts[k:] > counts[:-k]
     return mask
 
 
@@ -104,10 +142,7 @@ class Slicer:
             return waveform[begin * self.hop_size: min(waveform.shape[0], end * self.hop_size)]
 
     def get_rms_list(self, waveform) -> np.ndarray:
-        if len(waveform.shape) > 1:
-            samples = waveform.mean(axis=0)
-        else:
-            samples = waveform
+        samples = downmix(waveform)
         rms_list = get_rms(y=samples, frame_length=self.win_size, hop_length=self.hop_size).squeeze(0)
         return rms_list
 
@@ -119,16 +154,14 @@ class Slicer:
         vad_mask=None,
         rms_list: np.ndarray | None = None,
     ):
-        if len(waveform.shape) > 1:
-            samples = waveform.mean(axis=0)
-        else:
-            samples = waveform
-        total_frames = (samples.shape[0] + self.hop_size - 1) // self.hop_size
+        # Samples run along the last axis; only downmix when the RMS is not
+        # supplied, since the frame count needs just the length.
+        total_frames = (waveform.shape[-1] + self.hop_size - 1) // self.hop_size
         if total_frames <= self.min_length:
             waveform_shape = waveform.shape[1] if len(waveform.shape) > 1 else waveform.shape[0]
             return [], total_frames, waveform_shape
         if rms_list is None:
-            rms_list = get_rms(y=samples, frame_length=self.win_size, hop_length=self.hop_size).squeeze(0)
+            rms_list = self.get_rms_list(waveform)
         threshold = self.threshold
         if dynamic_threshold_db is not None:
             threshold = 10 ** (dynamic_threshold_db / 20.)
@@ -136,24 +169,21 @@ class Slicer:
             length = min(len(rms_list), len(vad_mask))
             rms_list = rms_list.copy()
             rms_list[:length][vad_mask[:length]] = max(threshold, rms_list.max()) + 1e-6
+        # Only the edges of silent runs drive slicing, so walk those runs
+        # instead of comparing every frame as a NumPy scalar
+        edges = np.flatnonzero(np.diff(rms_list < threshold, prepend=False, append=False))
+        runs = edges.reshape(-1, 2).tolist()
+        total_frames = rms_list.shape[0]
+        trailing_start = None
+        if runs and runs[-1][1] == total_frames:
+            trailing_start = runs.pop()[0]
         sil_tags = []
-        silence_start = None
         clip_start = 0
-        for i, rms in enumerate(rms_list):
-            # Keep looping while frame is silent.
-            if rms < threshold:
-                # Record start of silent frames.
-                if silence_start is None:
-                    silence_start = i
-                continue
-            # Keep looping while frame is not silent and silence start has not been recorded.
-            if silence_start is None:
-                continue
+        for silence_start, i in runs:
             # Clear recorded silence start if interval is not enough or clip is too short
             is_leading_silence = silence_start == 0 and i > self.max_sil_kept
             need_slice_middle = i - silence_start >= self.min_interval and i - clip_start >= self.min_length
             if not is_leading_silence and not need_slice_middle:
-                silence_start = None
                 continue
             # Need slicing. Record the range of silent frames to be removed.
             if i - silence_start <= self.max_sil_kept:
@@ -182,12 +212,10 @@ class Slicer:
                 else:
                     sil_tags.append((pos_l, pos_r))
                 clip_start = pos_r
-            silence_start = None
         # Deal with trailing silence.
-        total_frames = rms_list.shape[0]
-        if silence_start is not None and total_frames - silence_start >= self.min_interval:
-            silence_end = min(total_frames, silence_start + self.max_sil_kept)
-            pos = rms_list[silence_start: silence_end + 1].argmin() + silence_start
+        if trailing_start is not None and total_frames - trailing_start >= self.min_interval:
+            silence_end = min(total_frames, trailing_start + self.max_sil_kept)
+            pos = rms_list[trailing_start: silence_end + 1].argmin() + trailing_start
             sil_tags.append((pos, total_frames + 1))
         waveform_shape = waveform.shape[1] if len(waveform.shape) > 1 else waveform.shape[0]
         return sil_tags, total_frames, waveform_shape
@@ -0,0 +1,93 @@
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+SRC_DIR = ROOT_DIR / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from audio_slicer.utils import processing
+
+
+class FakeAV:
+    # Stands in for the PyAV module; every open fails so the call is visible
+    def __init__(self):
+        self.opened = []
+
+    def open(self, filename):
+        self.opened.append(filename)
+        raise RuntimeError("fake PyAV failure")
+
+
+class FallbackOrderTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmp.name, "input.m4a")
+        # Not something libsndfile can read, so every run takes the fallback
+        with open(self.filename, "wb") as f:
+            f.write(b"not audio")
+        self.av = FakeAV()
+        sr = 16000
+        tone = 0.5 * np.sin(2 * np.pi * 440 * np.arange(sr * 2) / sr).astype(np.float32)
+        self.decoded = (tone, sr, None)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def process(self, fallback_mode: str, ffmpeg_path: str | None):
+        ffmpeg = mock.Mock(return_value=self.decoded)
+        with mock.patch.object(processing, "_av_module", return_value=self.av), \
+                mock.patch.object(processing, "resolve_ffmpeg_path", return_value=ffmpeg_path), \
+                mock.patch.object(processing, "_read_with_ffmpeg", ffmpeg):
+            result = processing.process_audio_file(
+                self.filename,
+                output_ext="wav",
+                threshold_db=-40.0,
+                min_length=500,
+                min_interval=300,
+                hop_size=10,
+                max_silence=1000,
+                dynamic_enabled=False,
+                dynamic_offset_db=6.0,
+                vad_enabled=False,
+                vad_sensitivity_db=6.0,
+                vad_hangover_ms=120,
+                name_prefix="",
+                name_suffix="",
+                name_timestamp=False,
+                export_csv=False,
+                export_json=False,
+                output_dir=os.path.join(self.tmp.name, "out"),
+                fallback_mode=fallback_mode,
+                language="en",
+            )
+        return result, ffmpeg
+
+    def test_ffmpeg_mode_uses_configured_binary(self):
+        (ok, error, _), ffmpeg = self.process("ffmpeg", "/opt/ffmpeg")
+        self.assertTrue(ok, error)
+        self.assertEqual(self.av.opened, [])
+        ffmpeg.assert_called_once_with(self.filename, "/opt/ffmpeg")
+
+    def test_ffmpeg_mode_without_binary_uses_pyav(self):
+        (ok, error, _), ffmpeg = self.process("ffmpeg", None)
+        self.assertFalse(ok)
+        self.assertEqual(self.av.opened, [self.filename])
+        self.assertIn("PyAV: fake PyAV failure", error)
+        ffmpeg.assert_not_called()
+
+    def test_auto_chain_tries_pyav_before_binary(self):
+        (ok, error, _), ffmpeg = self.process("ffmpeg_then_librosa", "/opt/ffmpeg")
+        self.assertTrue(ok, error)
+        self.assertEqual(self.av.opened, [self.filename])
+        ffmpeg.assert_called_once_with(self.filename, "/opt/ffmpeg")
+
+
+if __name__ == "__main__":
+    unittest.main()